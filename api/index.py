@@ -10,8 +10,12 @@ current_dir = Path(__file__).resolve().parent
 backend_dir = current_dir.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-from mangum import Mangum
 from api.main import app
 
-# Vercel requires ASGI handler via Mangum
-handler = Mangum(app, lifespan="off")
+# Vercel's Python runtime serves ASGI apps natively; only wrap with
+# Mangum when running on a bare AWS Lambda
+if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+    from mangum import Mangum
+    handler = Mangum(app, lifespan="off")
+else:
+    handler = app
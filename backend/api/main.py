@@ -1,20 +1,47 @@
 """Main FastAPI Application"""
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
 
 from core.config import settings
-from core.rate_limiter import limiter
+from core.http_client import close_http_client, get_http_client
+from core.rate_limiter import TokenBucketMiddleware
+from core.responses import ORJSONFallbackResponse
+from core.worker_pool import WorkerPool
 from core.exceptions import ConverterException
 
 # Import routers
-from api.routes import ai_data, media, finance, developer, utility, education
+from api.routes import ai_data, media, finance, developer, utility, education, batch
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up worker pools, the HTTP client and the OpenAPI schema on startup, release them on shutdown"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    app.state.image_pool = None
+    if settings.IMAGE_POOL_WORKERS > 0:
+        # Gunicorn runs several app workers per host, so each keeps a small pool
+        app.state.image_pool = WorkerPool(settings.IMAGE_POOL_WORKERS)
+    # core.http_client owns the client routes use; open it now and close it below
+    get_http_client()
+    # Fetch tokenizer files in the background so startup does not wait on the network
+    from converters.ai_data import TokenCounterConverter
+    TokenCounterConverter.preload_encoders()
+    app.openapi()
+    yield
+    await ai_data.token_batcher.stop()
+    await close_http_client()
+    if app.state.image_pool is not None:
+        app.state.image_pool.shutdown()
 
 
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONFallbackResponse,
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description=settings.APP_DESCRIPTION,
@@ -23,9 +50,14 @@ app = FastAPI(
     openapi_url="/api/openapi.json"
 )
 
-# Add rate limiter
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+# Add rate limiter (registered before CORS so 429 responses still get CORS headers)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        TokenBucketMiddleware,
+        capacity=settings.RATE_LIMIT_PER_HOUR,
+        refill_rate=settings.RATE_LIMIT_PER_HOUR / 3600,
+        exempt_paths=("/", f"{settings.API_PREFIX}/health")
+    )
 
 # Add CORS middleware
 app.add_middleware(
@@ -69,6 +101,7 @@ async def health_check():
 
 
 # Include routers
+app.include_router(batch.router, prefix=settings.API_PREFIX)
 app.include_router(ai_data.router, prefix=settings.API_PREFIX)
 app.include_router(media.router, prefix=settings.API_PREFIX)
 app.include_router(finance.router, prefix=settings.API_PREFIX)
@@ -77,11 +110,15 @@ app.include_router(utility.router, prefix=settings.API_PREFIX)
 app.include_router(education.router, prefix=settings.API_PREFIX)
 
 
+# Development server only; production runs multiple workers via gunicorn_conf.py
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         reload=True
     )
@@ -1 +1,11 @@
 """API Routes package"""
+from pydantic import ConfigDict
+
+from core.config import settings
+
+# Shared config for request models: immutable, no unknown fields, bounded strings
+REQUEST_MODEL_CONFIG = ConfigDict(
+    extra="forbid",
+    frozen=True,
+    str_max_length=settings.MAX_UPLOAD_SIZE
+)
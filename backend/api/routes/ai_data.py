@@ -1,14 +1,27 @@
 """AI & Data API Routes"""
-from fastapi import APIRouter, HTTPException
+import codecs
+import io
+import json
+import tempfile
+from typing import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from converters.ai_data import CSVToJSONLConverter, TokenCounterConverter, JSONToCSVConverter
-from core.exceptions import ConverterException
+from core import json_utils
+from core.batcher import AsyncBatcher
+from core.config import settings
+from core.exceptions import ConverterException, FileSizeException, ValidationException
+from api.routes import REQUEST_MODEL_CONFIG
 
 router = APIRouter(prefix="/ai-data", tags=["AI & Data"])
 
 
 # Request/Response Models
 class CSVToJSONLRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     csv_content: str = Field(..., description="CSV content to convert")
 
 class CSVToJSONLResponse(BaseModel):
@@ -17,8 +30,13 @@ class CSVToJSONLResponse(BaseModel):
 
 
 class TokenCountRequest(BaseModel):
-    text: str = Field(..., description="Text to count tokens")
+    model_config = REQUEST_MODEL_CONFIG
+
+    text: str = Field(..., min_length=1, description="Text to count tokens")
     model: str = Field(default="gpt-4", description="LLM model (gpt-4, claude, gemini)")
+    cached_tokens: int = Field(default=0, ge=0, description="Prompt tokens read from the prompt cache")
+    cache_write_tokens: int = Field(default=0, ge=0, description="Prompt tokens written to the prompt cache")
+    output_tokens: int = Field(default=0, ge=0, description="Expected completion tokens")
 
 class TokenCountResponse(BaseModel):
     characters: int
@@ -29,6 +47,8 @@ class TokenCountResponse(BaseModel):
 
 
 class JSONToCSVRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     json_content: str = Field(..., description="JSON content (array of objects)")
 
 class JSONToCSVResponse(BaseModel):
@@ -36,9 +56,64 @@ class JSONToCSVResponse(BaseModel):
     row_count: int
 
 
+def _count_tokens_batch(batch: list[TokenCountRequest]) -> list:
+    """Count tokens for queued requests, one converter call per model; a failing model fails only its requests"""
+    from converters.ai_data import TokenCounterConverter
+    
+    by_model: dict[str, list[int]] = {}
+    for i, item in enumerate(batch):
+        by_model.setdefault(item.model, []).append(i)
+    
+    results: list = [None] * len(batch)
+    for model, indexes in by_model.items():
+        try:
+            counts = TokenCounterConverter.count_tokens_batch(
+                [batch[i].text for i in indexes],
+                model,
+                [(batch[i].cached_tokens, batch[i].cache_write_tokens, batch[i].output_tokens) for i in indexes]
+            )
+        except Exception as e:
+            counts = [e] * len(indexes)
+        for i, count in zip(indexes, counts):
+            results[i] = count
+    return results
+
+
+# Request bodies above this size are spooled to disk by the streaming endpoints
+STREAM_SPOOL_SIZE = 1024 * 1024
+
+
+async def _iter_body(request: Request) -> AsyncIterator[bytes]:
+    """
+    Yield the raw request body, failing once it exceeds MAX_UPLOAD_SIZE or is not UTF-8
+    
+    Checking the encoding up front matters for streamed responses: once the
+    first line is sent, a decoding error can no longer become a 4xx.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > settings.MAX_UPLOAD_SIZE:
+                raise FileSizeException()
+            decoder.decode(chunk)
+            yield chunk
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise ValidationException(f"Request body is not valid UTF-8: {e.reason}")
+
+
+token_batcher = AsyncBatcher(
+    _count_tokens_batch,
+    max_batch_size=settings.TOKEN_BATCH_SIZE,
+    max_queue_time=settings.TOKEN_BATCH_WAIT
+)
+
+
 # Endpoints
 @router.post("/csv-to-jsonl", response_model=CSVToJSONLResponse, summary="Convert CSV to JSONL")
-async def csv_to_jsonl(request: CSVToJSONLRequest):
+def csv_to_jsonl(request: CSVToJSONLRequest):
     """
     Convert CSV to JSONL format for AI fine-tuning datasets.
     
@@ -49,9 +124,10 @@ async def csv_to_jsonl(request: CSVToJSONLRequest):
     }
     ```
     """
+    from converters.ai_data import CSVToJSONLConverter
+    
     try:
-        result = CSVToJSONLConverter.convert(request.csv_content)
-        line_count = len(result.split('\n'))
+        result, line_count = CSVToJSONLConverter.convert(request.csv_content)
         
         return CSVToJSONLResponse(
             jsonl_content=result,
@@ -68,6 +144,10 @@ async def token_count(request: TokenCountRequest):
     """
     Count tokens and estimate cost for LLM prompts.
     
+    Pass `cached_tokens` / `cache_write_tokens` to price prompt-cache reads
+    and writes at the provider's cache rates, and `output_tokens` to include
+    the completion.
+    
     **Example Request:**
     ```json
     {
@@ -77,7 +157,7 @@ async def token_count(request: TokenCountRequest):
     ```
     """
     try:
-        result = TokenCounterConverter.count_tokens(request.text, request.model)
+        result = await token_batcher.process(request)
         return TokenCountResponse(**result)
     except ConverterException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
@@ -86,7 +166,7 @@ async def token_count(request: TokenCountRequest):
 
 
 @router.post("/json-to-csv", response_model=JSONToCSVResponse, summary="Convert JSON to CSV")
-async def json_to_csv(request: JSONToCSVRequest):
+def json_to_csv(request: JSONToCSVRequest):
     """
     Convert JSON array to CSV format.
     
@@ -97,9 +177,10 @@ async def json_to_csv(request: JSONToCSVRequest):
     }
     ```
     """
+    from converters.ai_data import JSONToCSVConverter
+    
     try:
-        result = JSONToCSVConverter.convert(request.json_content)
-        row_count = len(result.split('\n')) - 1  # Subtract header
+        result, row_count = JSONToCSVConverter.convert(request.json_content)
         
         return JSONToCSVResponse(
             csv_content=result,
@@ -109,3 +190,77 @@ async def json_to_csv(request: JSONToCSVRequest):
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/csv-to-jsonl-stream", summary="Stream CSV to JSONL")
+async def csv_to_jsonl_stream(request: Request):
+    """
+    Convert CSV to JSONL without buffering either side in memory.
+    
+    The request body is the raw CSV (not wrapped in JSON); the response is
+    streamed as newline-delimited JSON, one line per row. Bodies larger than
+    the upload limit are rejected with 413.
+    
+    **Example Request:**
+    ```
+    curl -X POST --data-binary @data.csv /api/ai-data/csv-to-jsonl-stream
+    ```
+    """
+    from converters.ai_data import CSVToJSONLConverter
+    
+    spool = tempfile.SpooledTemporaryFile(max_size=STREAM_SPOOL_SIZE)
+    written = 0
+    try:
+        async for chunk in _iter_body(request):
+            written += len(chunk)
+            # Past STREAM_SPOOL_SIZE the spool is on disk; write from a thread to keep the event loop free
+            if written > STREAM_SPOOL_SIZE:
+                await run_in_threadpool(spool.write, chunk)
+            else:
+                spool.write(chunk)
+        spool.seek(0)
+        
+        lines = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+        rows = CSVToJSONLConverter.iter_convert(lines)
+    except ConverterException as e:
+        spool.close()
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        spool.close()
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    def generate():
+        with lines:
+            yield from rows
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.post("/json-to-csv-stream", summary="Stream JSON to CSV")
+async def json_to_csv_stream(request: Request):
+    """
+    Convert a JSON array to CSV, streaming the output row by row.
+    
+    The request body is the raw JSON array (not wrapped in a string field),
+    so it is parsed only once. Bodies larger than the upload limit are
+    rejected with 413.
+    
+    **Example Request:**
+    ```json
+    [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+    ```
+    """
+    from converters.ai_data import JSONToCSVConverter
+    
+    try:
+        try:
+            data = json_utils.loads(b"".join([chunk async for chunk in _iter_body(request)]))
+        except json.JSONDecodeError as e:
+            raise ValidationException(f"Invalid JSON: {str(e)}")
+        rows = JSONToCSVConverter.iter_convert(data)
+    except ConverterException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(rows, media_type="text/csv")
@@ -0,0 +1,131 @@
+"""Batch API Routes"""
+import asyncio
+import inspect
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request, params
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field, ValidationError
+
+from api.routes import REQUEST_MODEL_CONFIG, ai_data, developer, education, finance, utility
+from core.config import settings
+from core.rate_limiter import rate_limit_response
+
+router = APIRouter(tags=["Batch"])
+
+
+# Request/Response Models
+class BatchSubRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
+    id: str = Field(..., description="Client-chosen id echoed back in the response")
+    url: str = Field(..., description="Endpoint path (e.g., /api/developer/base64-encode)")
+    method: str = Field(default="POST", description="HTTP method")
+    body: dict[str, Any] = Field(default_factory=dict, description="JSON body for the endpoint")
+
+
+class BatchRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
+    requests: list[BatchSubRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_MAX_REQUESTS,
+        description="Converter calls to run"
+    )
+
+
+class BatchSubResponse(BaseModel):
+    id: str
+    status: int
+    body: Any
+
+
+class BatchResponse(BaseModel):
+    responses: list[BatchSubResponse]
+
+
+def _build_registry() -> dict[tuple[str, str], tuple[Any, type[BaseModel], dict[str, Any]]]:
+    """Map (method, path) to the endpoint function, its request model and its dependencies"""
+    registry = {}
+    # Media endpoints take multipart uploads and are not batchable
+    for module in (ai_data, developer, education, finance, utility):
+        for route in module.router.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            param, *extra = inspect.signature(route.endpoint).parameters.values()
+            # Raw-body (streaming) endpoints have no request model
+            if not (inspect.isclass(param.annotation) and issubclass(param.annotation, BaseModel)):
+                continue
+            # Only argument-less dependencies (e.g. the shared HTTP client) are resolved here
+            dependencies = {
+                p.name: p.default.dependency for p in extra if isinstance(p.default, params.Depends)
+            }
+            for method in route.methods:
+                registry[(method, settings.API_PREFIX + route.path)] = (
+                    route.endpoint, param.annotation, dependencies
+                )
+    return registry
+
+
+_HANDLERS = _build_registry()
+
+
+async def _dispatch(sub: BatchSubRequest) -> BatchSubResponse:
+    """Run a single sub-request through its endpoint function"""
+    entry = _HANDLERS.get((sub.method.upper(), sub.url))
+    if entry is None:
+        return BatchSubResponse(
+            id=sub.id,
+            status=404,
+            body={"detail": f"Unsupported batch target: {sub.method.upper()} {sub.url}"}
+        )
+
+    endpoint, model, dependencies = entry
+    try:
+        payload = model.model_validate(sub.body)
+        kwargs = {name: dependency() for name, dependency in dependencies.items()}
+        if inspect.iscoroutinefunction(endpoint):
+            result = await endpoint(payload, **kwargs)
+        else:
+            result = await run_in_threadpool(endpoint, payload, **kwargs)
+    except ValidationError as e:
+        return BatchSubResponse(id=sub.id, status=422, body={"detail": jsonable_encoder(e.errors())})
+    except HTTPException as e:
+        return BatchSubResponse(id=sub.id, status=e.status_code, body={"detail": e.detail})
+
+    return BatchSubResponse(id=sub.id, status=200, body=jsonable_encoder(result))
+
+
+# Endpoints
+@router.post("/batch", response_model=BatchResponse, summary="Run several converters in one call")
+async def batch(request: BatchRequest, http_request: Request):
+    """
+    Run several converter calls in a single HTTP request.
+
+    Sub-requests run concurrently and each gets its own status code;
+    one failing call does not fail the batch. Each sub-request counts
+    against the rate limit like a separate call. File upload (media)
+    endpoints are not supported.
+
+    **Example Request:**
+    ```json
+    {
+        "requests": [
+            {"id": "1", "url": "/api/developer/base64-encode", "body": {"text": "Hello"}},
+            {"id": "2", "url": "/api/utility/unit-convert", "body": {"value": 1, "from_unit": "mile", "to_unit": "kilometer", "category": "length"}}
+        ]
+    }
+    ```
+    """
+    # The middleware already took one token for this HTTP request
+    charge = getattr(http_request.state, "rate_limit", None)
+    if charge is not None:
+        wait = charge(len(request.requests) - 1)
+        if wait:
+            return rate_limit_response(wait)
+    
+    responses = await asyncio.gather(*(_dispatch(sub) for sub in request.requests))
+    return BatchResponse(responses=list(responses))
@@ -1,32 +1,42 @@
 """Developer Tools API Routes"""
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from converters.developer import JSONToYAMLConverter, Base64Converter, JWTDecoder
 from core.exceptions import ConverterException
 from typing import Any, Optional
+from api.routes import REQUEST_MODEL_CONFIG
 
 router = APIRouter(prefix="/developer", tags=["Developer Tools"])
 
 
 # Request/Response Models
 class JSONToYAMLRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     json_content: str = Field(..., description="JSON content")
 
 
 class YAMLToJSONRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     yaml_content: str = Field(..., description="YAML content")
     pretty: bool = Field(default=True, description="Pretty print JSON")
 
 
 class Base64EncodeRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     text: str = Field(..., description="Text to encode")
 
 
 class Base64DecodeRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     encoded_text: str = Field(..., description="Base64 encoded text")
 
 
 class JWTDecodeRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     token: str = Field(..., description="JWT token")
     verify: bool = Field(default=False, description="Verify signature")
     secret: Optional[str] = Field(default=None, description="Secret key for verification")
@@ -42,7 +52,7 @@ class JWTDecodeResponse(BaseModel):
 
 # Endpoints
 @router.post("/json-to-yaml", summary="Convert JSON to YAML")
-async def json_to_yaml(request: JSONToYAMLRequest):
+def json_to_yaml(request: JSONToYAMLRequest):
     """
     Convert JSON to YAML format.
     
@@ -53,6 +63,8 @@ async def json_to_yaml(request: JSONToYAMLRequest):
     }
     ```
     """
+    from converters.developer import JSONToYAMLConverter
+    
     try:
         result = JSONToYAMLConverter.json_to_yaml(request.json_content)
         return {"yaml_content": result}
@@ -63,7 +75,7 @@ async def json_to_yaml(request: JSONToYAMLRequest):
 
 
 @router.post("/yaml-to-json", summary="Convert YAML to JSON")
-async def yaml_to_json(request: YAMLToJSONRequest):
+def yaml_to_json(request: YAMLToJSONRequest):
     """
     Convert YAML to JSON format.
     
@@ -75,6 +87,8 @@ async def yaml_to_json(request: YAMLToJSONRequest):
     }
     ```
     """
+    from converters.developer import JSONToYAMLConverter
+    
     try:
         result = JSONToYAMLConverter.yaml_to_json(request.yaml_content, request.pretty)
         return {"json_content": result}
@@ -85,7 +99,7 @@ async def yaml_to_json(request: YAMLToJSONRequest):
 
 
 @router.post("/base64-encode", summary="Encode to Base64")
-async def base64_encode(request: Base64EncodeRequest):
+def base64_encode(request: Base64EncodeRequest):
     """
     Encode text to Base64.
     
@@ -96,6 +110,8 @@ async def base64_encode(request: Base64EncodeRequest):
     }
     ```
     """
+    from converters.developer import Base64Converter
+    
     try:
         result = Base64Converter.encode(request.text)
         return {"encoded_text": result}
@@ -106,7 +122,7 @@ async def base64_encode(request: Base64EncodeRequest):
 
 
 @router.post("/base64-decode", summary="Decode from Base64")
-async def base64_decode(request: Base64DecodeRequest):
+def base64_decode(request: Base64DecodeRequest):
     """
     Decode Base64 to text.
     
@@ -117,6 +133,8 @@ async def base64_decode(request: Base64DecodeRequest):
     }
     ```
     """
+    from converters.developer import Base64Converter
+    
     try:
         result = Base64Converter.decode(request.encoded_text)
         return {"decoded_text": result}
@@ -127,7 +145,7 @@ async def base64_decode(request: Base64DecodeRequest):
 
 
 @router.post("/jwt-decode", response_model=JWTDecodeResponse, summary="Decode JWT token")
-async def jwt_decode(request: JWTDecodeRequest):
+def jwt_decode(request: JWTDecodeRequest):
     """
     Decode and validate JWT tokens.
     
@@ -139,6 +157,8 @@ async def jwt_decode(request: JWTDecodeRequest):
     }
     ```
     """
+    from converters.developer import JWTDecoder
+    
     try:
         result = JWTDecoder.decode(request.token, request.verify, request.secret)
         return JWTDecodeResponse(**result)
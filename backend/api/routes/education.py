@@ -1,15 +1,17 @@
 """Education & Engineering API Routes"""
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from converters.education import NumberSystemConverter, ColorCodeConverter, PercentageCalculator
 from core.exceptions import ConverterException
 from typing import Any, Optional
+from api.routes import REQUEST_MODEL_CONFIG
 
 router = APIRouter(prefix="/education", tags=["Education & Engineering"])
 
 
 # Request/Response Models
 class NumberSystemRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     number: str = Field(..., description="Number to convert")
     from_system: str = Field(..., description="Source system (binary, octal, decimal, hexadecimal)")
     to_system: str = Field(..., description="Target system")
@@ -24,19 +26,23 @@ class NumberSystemResponse(BaseModel):
 
 
 class ColorConvertRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     color_value: str = Field(..., description="Color value (HEX or RGB as 'r,g,b')")
     from_format: str = Field(..., description="Source format (hex, rgb)")
     to_format: Optional[str] = Field(default=None, description="Target format (optional, returns all if not specified)")
 
 
 class PercentageRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     calculation_type: str = Field(..., description="Type: percentage_of, what_percent, increase, decrease, change")
     values: dict[str, float] = Field(..., description="Values for calculation")
 
 
 # Endpoints
 @router.post("/number-system", response_model=NumberSystemResponse, summary="Convert number systems")
-async def number_system(request: NumberSystemRequest):
+def number_system(request: NumberSystemRequest):
     """
     Convert between number systems (Binary, Octal, Decimal, Hexadecimal).
     
@@ -49,6 +55,8 @@ async def number_system(request: NumberSystemRequest):
     }
     ```
     """
+    from converters.education import NumberSystemConverter
+    
     try:
         result = NumberSystemConverter.convert(
             request.number,
@@ -63,7 +71,7 @@ async def number_system(request: NumberSystemRequest):
 
 
 @router.post("/color-convert", summary="Convert color codes")
-async def color_convert(request: ColorConvertRequest):
+def color_convert(request: ColorConvertRequest):
     """
     Convert between color code formats (HEX, RGB, HSL, CMYK).
     
@@ -75,6 +83,8 @@ async def color_convert(request: ColorConvertRequest):
     }
     ```
     """
+    from converters.education import ColorCodeConverter
+    
     try:
         result = ColorCodeConverter.convert(
             request.color_value,
@@ -89,7 +99,7 @@ async def color_convert(request: ColorConvertRequest):
 
 
 @router.post("/percentage-calculate", summary="Calculate percentage")
-async def percentage_calculate(request: PercentageRequest):
+def percentage_calculate(request: PercentageRequest):
     """
     Calculate percentages.
     
@@ -108,6 +118,8 @@ async def percentage_calculate(request: PercentageRequest):
     }
     ```
     """
+    from converters.education import PercentageCalculator
+    
     try:
         result = PercentageCalculator.calculate(
             request.calculation_type,
@@ -1,14 +1,18 @@
 """Finance API Routes"""
-from fastapi import APIRouter, HTTPException
+import httpx
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from converters.finance import CurrencyConverter, CryptoPriceTracker, GSTCalculator
 from core.exceptions import ConverterException
+from core.http_client import get_http_client
+from api.routes import REQUEST_MODEL_CONFIG
 
 router = APIRouter(prefix="/finance", tags=["Finance"])
 
 
 # Request/Response Models
 class CurrencyConvertRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     amount: float = Field(..., gt=0, description="Amount to convert")
     from_currency: str = Field(..., description="Source currency code (e.g., USD)")
     to_currency: str = Field(..., description="Target currency code (e.g., EUR)")
@@ -23,7 +27,24 @@ class CurrencyConvertResponse(BaseModel):
     timestamp: str
 
 
+class CurrencyConvertBatchRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
+    conversions: list[CurrencyConvertRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Conversions to run"
+    )
+
+
+class CurrencyConvertBatchResponse(BaseModel):
+    results: list[CurrencyConvertResponse]
+
+
 class CryptoPriceRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     crypto_symbol: str = Field(..., description="Crypto symbol (BTC, ETH, etc.)")
     vs_currency: str = Field(default="USD", description="Target currency (USD, EUR, etc.)")
 
@@ -37,6 +58,8 @@ class CryptoPriceResponse(BaseModel):
 
 
 class GSTCalculateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     amount: float = Field(..., gt=0, description="Base or total amount")
     tax_rate: float = Field(..., ge=0, le=100, description="Tax rate percentage")
     include_tax: bool = Field(default=False, description="True if amount includes tax")
@@ -52,7 +75,10 @@ class GSTCalculateResponse(BaseModel):
 
 # Endpoints
 @router.post("/currency-convert", response_model=CurrencyConvertResponse, summary="Convert currency")
-async def currency_convert(request: CurrencyConvertRequest):
+async def currency_convert(
+    request: CurrencyConvertRequest,
+    client: httpx.AsyncClient = Depends(get_http_client)
+):
     """
     Convert between currencies using real-time exchange rates.
     
@@ -65,11 +91,14 @@ async def currency_convert(request: CurrencyConvertRequest):
     }
     ```
     """
+    from converters.finance import CurrencyConverter
+    
     try:
-        result = CurrencyConverter.convert(
+        result = await CurrencyConverter.convert(
             request.amount,
             request.from_currency,
-            request.to_currency
+            request.to_currency,
+            client
         )
         return CurrencyConvertResponse(**result)
     except ConverterException as e:
@@ -78,8 +107,50 @@ async def currency_convert(request: CurrencyConvertRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/currency-convert-batch",
+    response_model=CurrencyConvertBatchResponse,
+    summary="Convert several currency amounts"
+)
+async def currency_convert_batch(
+    request: CurrencyConvertBatchRequest,
+    client: httpx.AsyncClient = Depends(get_http_client)
+):
+    """
+    Convert several amounts in one call. Exchange rates are fetched once
+    per source currency.
+    
+    **Example Request:**
+    ```json
+    {
+        "conversions": [
+            {"amount": 100, "from_currency": "USD", "to_currency": "EUR"},
+            {"amount": 50, "from_currency": "USD", "to_currency": "INR"}
+        ]
+    }
+    ```
+    """
+    from converters.finance import CurrencyConverter
+    
+    try:
+        results = await CurrencyConverter.convert_many(
+            [(c.amount, c.from_currency, c.to_currency) for c in request.conversions],
+            client
+        )
+        return CurrencyConvertBatchResponse(
+            results=[CurrencyConvertResponse(**result) for result in results]
+        )
+    except ConverterException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/crypto-price", response_model=CryptoPriceResponse, summary="Get crypto price")
-async def crypto_price(request: CryptoPriceRequest):
+async def crypto_price(
+    request: CryptoPriceRequest,
+    client: httpx.AsyncClient = Depends(get_http_client)
+):
     """
     Get real-time cryptocurrency prices.
     
@@ -93,9 +164,12 @@ async def crypto_price(request: CryptoPriceRequest):
     }
     ```
     """
+    from converters.finance import CryptoPriceTracker
+    
     try:
-        result = CryptoPriceTracker.get_price(
+        result = await CryptoPriceTracker.get_price(
             request.crypto_symbol,
+            client,
             request.vs_currency
         )
         return CryptoPriceResponse(**result)
@@ -106,7 +180,7 @@ async def crypto_price(request: CryptoPriceRequest):
 
 
 @router.post("/gst-calculate", response_model=GSTCalculateResponse, summary="Calculate GST/Tax")
-async def gst_calculate(request: GSTCalculateRequest):
+def gst_calculate(request: GSTCalculateRequest):
     """
     Calculate GST/VAT/Sales Tax.
     
@@ -119,6 +193,8 @@ async def gst_calculate(request: GSTCalculateRequest):
     }
     ```
     """
+    from converters.finance import GSTCalculator
+    
     try:
         result = GSTCalculator.calculate(
             request.amount,
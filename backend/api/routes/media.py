@@ -1,9 +1,15 @@
 """Media API Routes"""
-from fastapi import APIRouter, HTTPException, UploadFile, File
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from converters.media import ImageToWebPConverter, ImageCompressorConverter, PDFToTextConverter
 from core.exceptions import ConverterException
-import base64
+import orjson
+import pybase64
 
 router = APIRouter(prefix="/media", tags=["Media"])
 
@@ -21,6 +27,8 @@ class ImageCompressionResponse(BaseModel):
     compressed_size_bytes: int
     compression_ratio_percent: float
     final_quality: int
+    width: int
+    height: int
 
 
 class PDFTextResponse(BaseModel):
@@ -30,22 +38,40 @@ class PDFTextResponse(BaseModel):
     word_count: int
 
 
+async def _run_image_task(request: Request, func: Callable, file: UploadFile, *args) -> Any:
+    """Run an image encoder on an upload in the process pool, or a thread when no pool is running"""
+    pool = getattr(request.app.state, "image_pool", None)
+    if pool is None:
+        # Threads read the spooled upload directly, without copying it into memory
+        return await run_in_threadpool(func, file.file, *args)
+    # Worker processes need picklable bytes
+    image_data = await file.read()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, image_data, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); the pool replaces itself, retry once
+        return await loop.run_in_executor(pool, func, image_data, *args)
+
+
 # Endpoints
 @router.post("/image-to-webp", response_model=ImageConversionResponse, summary="Convert image to WebP")
-async def image_to_webp(file: UploadFile = File(...), quality: int = 85):
+async def image_to_webp(request: Request, file: UploadFile = File(...), quality: int = 85, method: int = 4):
     """
     Convert images to WebP format for web optimization.
     
     **Parameters:**
     - file: Image file (JPEG, PNG, etc.)
     - quality: WebP quality 1-100 (default: 85)
+    - method: Encoder effort 0-6, higher is slower but smaller (default: 4)
     """
+    from converters.media import ImageToWebPConverter
+    
     try:
-        image_data = await file.read()
-        original_size = len(image_data)
+        original_size = file.size
         
-        webp_data = ImageToWebPConverter.convert(image_data, quality)
-        webp_base64 = base64.b64encode(webp_data).decode('utf-8')
+        webp_data = await _run_image_task(request, ImageToWebPConverter.convert, file, quality, method)
+        webp_base64 = pybase64.b64encode_as_string(webp_data)
         
         return ImageConversionResponse(
             webp_image=f"data:image/webp;base64,{webp_base64}",
@@ -59,18 +85,21 @@ async def image_to_webp(file: UploadFile = File(...), quality: int = 85):
 
 
 @router.post("/image-compress", response_model=ImageCompressionResponse, summary="Compress image")
-async def image_compress(file: UploadFile = File(...), max_size_kb: int = 500, quality: int = 85):
+async def image_compress(request: Request, file: UploadFile = File(...), max_size_kb: int = 500, quality: int = 85):
     """
     Compress images while maintaining quality.
     
+    Images already within max_size_kb are returned unchanged.
+    
     **Parameters:**
     - file: Image file
     - max_size_kb: Maximum target size in KB (default: 500)
     - quality: Initial compression quality (default: 85)
     """
+    from converters.media import ImageCompressorConverter
+    
     try:
-        image_data = await file.read()
-        result = ImageCompressorConverter.compress(image_data, max_size_kb, quality)
+        result = await _run_image_task(request, ImageCompressorConverter.compress, file, max_size_kb, quality)
         
         return ImageCompressionResponse(**result)
     except ConverterException as e:
@@ -80,16 +109,19 @@ async def image_compress(file: UploadFile = File(...), max_size_kb: int = 500, q
 
 
 @router.post("/pdf-to-text", response_model=PDFTextResponse, summary="Extract text from PDF")
-async def pdf_to_text(file: UploadFile = File(...)):
+async def pdf_to_text(request: Request, file: UploadFile = File(...)):
     """
     Extract text content from PDF files.
     
     **Parameters:**
     - file: PDF file
     """
+    from converters.media import PDFToTextConverter
+    
     try:
-        pdf_data = await file.read()
-        result = PDFToTextConverter.extract_text(pdf_data)
+        # Large documents are split across the worker processes, when running
+        pool = getattr(request.app.state, "image_pool", None)
+        result = await run_in_threadpool(PDFToTextConverter.extract_text, file.file, pool)
         
         return PDFTextResponse(
             total_pages=result['total_pages'],
@@ -101,3 +133,46 @@ async def pdf_to_text(file: UploadFile = File(...)):
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/pdf-to-text-stream", summary="Stream text extracted from PDF")
+async def pdf_to_text_stream(file: UploadFile = File(...)):
+    """
+    Extract text from PDF files page by page as newline-delimited JSON.
+    
+    Each line is `{"page": n, "text": "...", "chars": n}`; the last line is
+    `{"summary": {"total_pages": n, "character_count": n, "word_count": n}}`
+    with the same totals as `/pdf-to-text`.
+    
+    **Parameters:**
+    - file: PDF file
+    """
+    from converters.media import PDFToTextConverter
+    
+    try:
+        # Pages are read lazily while streaming; FastAPI closes the upload only after the response is sent
+        pages = await run_in_threadpool(PDFToTextConverter.iter_pages, file.file)
+    except ConverterException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    def generate():
+        total_pages = character_count = word_count = text_pages = 0
+        for page in pages:
+            text = page["text"]
+            total_pages += 1
+            if text:
+                # Match /pdf-to-text, which joins non-empty pages with a blank line
+                character_count += len(text) + (2 if text_pages else 0)
+                word_count += len(text.split())
+                text_pages += 1
+            yield orjson.dumps({**page, "chars": len(text)}) + b"\n"
+        
+        yield orjson.dumps({"summary": {
+            "total_pages": total_pages,
+            "character_count": character_count,
+            "word_count": word_count
+        }}) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
@@ -1,15 +1,17 @@
 """Daily Utility API Routes"""
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from converters.utility import UnitConverter, TimezoneConverter, QRCodeGenerator
 from core.exceptions import ConverterException
 from typing import Optional
+from api.routes import REQUEST_MODEL_CONFIG
 
 router = APIRouter(prefix="/utility", tags=["Daily Utility"])
 
 
 # Request/Response Models
 class UnitConvertRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     value: float = Field(..., description="Value to convert")
     from_unit: str = Field(..., description="Source unit")
     to_unit: str = Field(..., description="Target unit")
@@ -25,6 +27,8 @@ class UnitConvertResponse(BaseModel):
 
 
 class TimezoneConvertRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     time_str: str = Field(..., description="Time in HH:MM format")
     from_timezone: str = Field(..., description="Source timezone (e.g., America/New_York)")
     to_timezone: str = Field(..., description="Target timezone (e.g., Europe/London)")
@@ -40,6 +44,8 @@ class TimezoneConvertResponse(BaseModel):
 
 
 class QRCodeRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     data: str = Field(..., description="Text or URL to encode")
     size: int = Field(default=10, ge=1, le=40, description="QR code size")
     border: int = Field(default=4, ge=4, description="Border size")
@@ -54,7 +60,7 @@ class QRCodeResponse(BaseModel):
 
 # Endpoints
 @router.post("/unit-convert", response_model=UnitConvertResponse, summary="Convert units")
-async def unit_convert(request: UnitConvertRequest):
+def unit_convert(request: UnitConvertRequest):
     """
     Convert between different units.
     
@@ -70,6 +76,8 @@ async def unit_convert(request: UnitConvertRequest):
     }
     ```
     """
+    from converters.utility import UnitConverter
+    
     try:
         result = UnitConverter.convert(
             request.value,
@@ -85,7 +93,7 @@ async def unit_convert(request: UnitConvertRequest):
 
 
 @router.post("/timezone-convert", response_model=TimezoneConvertResponse, summary="Convert timezone")
-async def timezone_convert(request: TimezoneConvertRequest):
+def timezone_convert(request: TimezoneConvertRequest):
     """
     Convert times between timezones.
     
@@ -98,6 +106,8 @@ async def timezone_convert(request: TimezoneConvertRequest):
     }
     ```
     """
+    from converters.utility import TimezoneConverter
+    
     try:
         result = TimezoneConverter.convert(
             request.time_str,
@@ -113,7 +123,7 @@ async def timezone_convert(request: TimezoneConvertRequest):
 
 
 @router.post("/qr-generate", response_model=QRCodeResponse, summary="Generate QR code")
-async def qr_generate(request: QRCodeRequest):
+def qr_generate(request: QRCodeRequest):
     """
     Generate QR codes from text or URLs.
     
@@ -126,6 +136,8 @@ async def qr_generate(request: QRCodeRequest):
     }
     ```
     """
+    from converters.utility import QRCodeGenerator
+    
     try:
         result = QRCodeGenerator.generate(
             request.data,
@@ -0,0 +1 @@
+"""pytest configuration; makes the backend packages importable from the tests"""
@@ -1,16 +1,33 @@
 """AI & Data Converters"""
 import csv
-import json
 import io
-from typing import Dict, List, Any
+import json
+import logging
+import threading
+import time
+import orjson
+from itertools import zip_longest
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from core import json_utils
 from core.exceptions import ValidationException, ProcessingException
 
+try:
+    # Optional SIMD CSV parser; the csv module is used when it is missing
+    import cisv
+except ImportError:
+    cisv = None
+
+logger = logging.getLogger(__name__)
+
 
 class CSVToJSONLConverter:
     """Convert CSV data to JSONL format for AI fine-tuning"""
     
+    # Below this size the csv module wins over cisv's call overhead
+    CISV_MIN_SIZE = 64 * 1024
+    
     @staticmethod
-    def convert(csv_content: str) -> str:
+    def convert(csv_content: str) -> Tuple[str, int]:
         """
         Convert CSV to JSONL
         
@@ -18,80 +35,332 @@ class CSVToJSONLConverter:
             csv_content: CSV string content
             
         Returns:
-            JSONL formatted string
+            Tuple of JSONL formatted string and its line count
         """
         try:
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
-            
-            jsonl_lines = []
-            for row in reader:
-                jsonl_lines.append(json.dumps(row))
+            # Write lines straight into one buffer instead of collecting a list
+            output = io.BytesIO()
+            line_count = 0
+            for line in CSVToJSONLConverter.convert_stream(csv_content):
+                if line_count:
+                    output.write(b"\n")
+                output.write(line)
+                line_count += 1
             
-            if not jsonl_lines:
+            if not line_count:
                 raise ValidationException("CSV file is empty or has no valid rows")
                 
-            return "\n".join(jsonl_lines)
+            return output.getvalue().decode("utf-8"), line_count
         except csv.Error as e:
             raise ProcessingException(f"CSV parsing error: {str(e)}")
         except Exception as e:
             raise ProcessingException(f"Conversion failed: {str(e)}")
+    
+    @staticmethod
+    def convert_stream(csv_content: str) -> Iterator[bytes]:
+        """
+        Convert CSV to JSONL lazily, one line at a time
+        
+        Args:
+            csv_content: CSV string content
+            
+        Returns:
+            Iterator of UTF-8 encoded JSONL lines without trailing newlines;
+            empty when the CSV has no data rows
+        """
+        return CSVToJSONLConverter._iter_lines(CSVToJSONLConverter._reader(csv_content))
+    
+    @staticmethod
+    def iter_convert(lines: Iterable[str]) -> Iterator[bytes]:
+        """
+        Convert CSV to JSONL one row at a time
+        
+        The header and first row are read eagerly so an empty input is
+        rejected before any output is produced.
+        
+        Args:
+            lines: CSV lines (e.g. a text file opened with newline='')
+            
+        Returns:
+            Iterator of UTF-8 encoded JSONL lines, each ending with a newline
+        """
+        json_lines = CSVToJSONLConverter._iter_lines(csv.reader(lines))
+        try:
+            first_line = next(json_lines, None)
+        except csv.Error as e:
+            raise ProcessingException(f"CSV parsing error: {str(e)}")
+        
+        if first_line is None:
+            raise ValidationException("CSV file is empty or has no valid rows")
+        
+        def generate() -> Iterator[bytes]:
+            yield first_line + b"\n"
+            for line in json_lines:
+                yield line + b"\n"
+        
+        return generate()
+    
+    @staticmethod
+    def _reader(csv_content: str) -> Iterator[List[str]]:
+        """Return an iterator of parsed rows, using cisv for large inputs when installed"""
+        if cisv is not None and len(csv_content) > CSVToJSONLConverter.CISV_MIN_SIZE:
+            try:
+                # Parses in C with the GIL released
+                return iter(cisv.parse_string(csv_content, delimiter=",", quote='"'))
+            except cisv.CisvError:
+                # Let the csv module report the error
+                pass
+        return csv.reader(io.StringIO(csv_content))
+    
+    @staticmethod
+    def _iter_lines(reader: Iterator[List[str]]) -> Iterator[bytes]:
+        """
+        Serialize csv.reader rows as JSON objects keyed by the header row
+        
+        Blank lines are skipped. Short rows are padded with empty strings;
+        surplus fields are kept as a list under "null", as csv.DictReader did.
+        """
+        header = next((row for row in reader if row), None)
+        if header is None:
+            return
+        width = len(header)
+        
+        for row in reader:
+            if not row:
+                continue
+            if len(row) == width:
+                yield orjson.dumps(dict(zip(header, row)))
+            elif len(row) < width:
+                yield orjson.dumps(dict(zip_longest(header, row, fillvalue="")))
+            else:
+                record = dict(zip(header, row))
+                record[None] = row[width:]
+                yield orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
 
 
 class TokenCounterConverter:
     """Count tokens in text for LLM usage estimation"""
     
-    # Approximate token counts (1 token ≈ 4 characters for English)
+    # Fallback estimate when no tokenizer is available (1 token ≈ 4 characters for English)
     CHARS_PER_TOKEN = 4
     
+    # USD per 1M tokens (example rates, update with current pricing).
+    # "cached" is the cache-read rate, "write" the cache-write rate; tiers a
+    # model lacks are billed at its input rate. "min_cache" is the shortest
+    # prompt the provider caches.
+    RATES_PER_1M = {
+        "gpt-4": {"input": 30.00},
+        "gpt-3.5-turbo": {"input": 2.00},
+        "gpt-4o": {"input": 2.50, "cached": 1.25, "output": 10.00, "min_cache": 1024},
+        "gpt-4o-mini": {"input": 0.15, "cached": 0.075, "output": 0.60, "min_cache": 1024},
+        "claude": {"input": 24.00},
+        "claude-sonnet-4.5": {"input": 3.00, "cached": 0.30, "write": 3.75, "output": 15.00, "min_cache": 1024},
+        "claude-haiku-4.5": {"input": 1.00, "cached": 0.10, "write": 1.25, "output": 5.00, "min_cache": 1024},
+        "gemini": {"input": 0.25},
+        "gemini-2.5-pro": {"input": 1.25, "cached": 0.125, "output": 10.00, "min_cache": 4096},
+        "gemini-2.5-flash": {"input": 0.30, "cached": 0.03, "output": 2.50, "min_cache": 1024}
+    }
+    DEFAULT_RATES = {"input": 10.00}
+    
     @staticmethod
-    def count_tokens(text: str, model: str = "gpt-4") -> Dict[str, Any]:
+    def count_tokens(
+        text: str,
+        model: str = "gpt-4",
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        output_tokens: int = 0
+    ) -> Dict[str, Any]:
         """
         Count tokens in text
         
         Args:
             text: Input text
             model: LLM model name (gpt-4, claude, gemini)
+            cached_tokens: Prompt tokens read from the provider's prompt cache
+            cache_write_tokens: Prompt tokens written to the prompt cache
+            output_tokens: Expected completion tokens
             
         Returns:
             Dictionary with character count, word count, and estimated tokens
         """
-        if not text:
+        usage = (cached_tokens, cache_write_tokens, output_tokens)
+        return TokenCounterConverter.count_tokens_batch([text], model, [usage])[0]
+    
+    @staticmethod
+    def count_tokens_batch(
+        texts: List[str],
+        model: str = "gpt-4",
+        usages: Optional[List[Tuple[int, int, int]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Count tokens for several texts in one pass
+        
+        Args:
+            texts: Input texts
+            model: LLM model name (gpt-4, claude, gemini)
+            usages: Optional (cached_tokens, cache_write_tokens, output_tokens)
+                per text for the cost estimate
+            
+        Returns:
+            List of count dictionaries, in the same order as texts
+        """
+        if not all(texts):
             raise ValidationException("Text cannot be empty")
         
-        # Basic counts
-        char_count = len(text)
-        word_count = len(text.split())
+        # Exact BPE counts where tiktoken knows the model, else ~4 chars per token
+        encoder = _get_encoder(model.lower())
+        if encoder is not None:
+            token_counts = [len(encoder.encode_ordinary(text)) for text in texts]
+        else:
+            token_counts = [len(text) // TokenCounterConverter.CHARS_PER_TOKEN for text in texts]
+        
+        if usages is None:
+            usages = [(0, 0, 0)] * len(texts)
+        
+        results = []
+        for text, estimated_tokens, usage in zip(texts, token_counts, usages):
+            # Basic counts
+            char_count = len(text)
+            word_count = len(text.split())
+            
+            estimated_cost = TokenCounterConverter.estimate_cost(model, estimated_tokens, *usage)
+            
+            results.append({
+                "characters": char_count,
+                "words": word_count,
+                "estimated_tokens": estimated_tokens,
+                "model": model,
+                "estimated_cost_usd": round(estimated_cost, 6)
+            })
+        
+        return results
+    
+    @staticmethod
+    def preload_encoders() -> None:
+        """
+        Start loading the tiktoken encodings of the priced models in the background
         
-        # Estimate tokens (simple approximation)
-        # In production, you'd use tiktoken for GPT or model-specific tokenizers
-        estimated_tokens = char_count // TokenCounterConverter.CHARS_PER_TOKEN
+        tiktoken downloads each BPE file on first use; point TIKTOKEN_CACHE_DIR
+        at a directory shipped with the deployment to avoid the download.
+        Returns immediately.
+        """
+        for model in TokenCounterConverter.RATES_PER_1M:
+            _get_encoder(model)
+    
+    @staticmethod
+    def estimate_cost(
+        model: str,
+        input_tokens: int,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        output_tokens: int = 0
+    ) -> float:
+        """
+        Estimate the cost of a call, pricing prompt-cache reads and writes separately
         
-        # Cost estimation (example rates, update with current pricing)
-        cost_per_1k_tokens = {
-            "gpt-4": 0.03,
-            "gpt-3.5-turbo": 0.002,
-            "claude": 0.024,
-            "gemini": 0.00025
-        }
+        Args:
+            model: LLM model name
+            input_tokens: Total prompt tokens
+            cached_tokens: Prompt tokens read from the prompt cache
+            cache_write_tokens: Prompt tokens written to the prompt cache
+            output_tokens: Completion tokens
+            
+        Returns:
+            Estimated cost in USD
+        """
+        rates = TokenCounterConverter.RATES_PER_1M.get(model.lower(), TokenCounterConverter.DEFAULT_RATES)
+        input_rate = rates["input"]
         
-        rate = cost_per_1k_tokens.get(model.lower(), 0.01)
-        estimated_cost = (estimated_tokens / 1000) * rate
+        # Prompts shorter than the provider minimum are never cached
+        if input_tokens < rates.get("min_cache", 0):
+            cached_tokens = cache_write_tokens = 0
+        cached_tokens = min(cached_tokens, input_tokens)
+        cache_write_tokens = min(cache_write_tokens, input_tokens - cached_tokens)
+        uncached_tokens = input_tokens - cached_tokens - cache_write_tokens
         
-        return {
-            "characters": char_count,
-            "words": word_count,
-            "estimated_tokens": estimated_tokens,
-            "model": model,
-            "estimated_cost_usd": round(estimated_cost, 6)
-        }
+        cost = (
+            uncached_tokens * input_rate
+            + cached_tokens * rates.get("cached", input_rate)
+            + cache_write_tokens * rates.get("write", input_rate)
+            + output_tokens * rates.get("output", input_rate)
+        )
+        return cost / 1_000_000
+
+
+# Seconds a background encoding load may run before it counts as failed
+ENCODING_LOAD_TIMEOUT = 30
+# Seconds before loading an encoding is retried after a failure
+ENCODING_RETRY_SECONDS = 300
+
+# tiktoken encoding name -> loaded encoding (a handful of names at most)
+_ENCODINGS: Dict[str, Any] = {}
+# Encoding name -> monotonic start time of a background load in progress
+_ENCODING_LOADS: Dict[str, float] = {}
+# Encoding name -> monotonic time of the last failed load
+_ENCODING_FAILURES: Dict[str, float] = {}
+_encoding_lock = threading.Lock()
+
+
+def _get_encoder(model: str) -> Any:
+    """
+    Return the tiktoken encoding for model, or None if it is not available (yet)
+    
+    Never waits for a BPE download (tiktoken fetches it without a timeout):
+    a missing encoding is loaded in a background thread and the caller falls
+    back to the character estimate until it is ready.
+    """
+    try:
+        from tiktoken.model import encoding_name_for_model
+        name = encoding_name_for_model(model)
+    except (ImportError, KeyError):
+        # tiktoken not installed, or not an OpenAI model
+        return None
+    
+    encoding = _ENCODINGS.get(name)
+    if encoding is None:
+        _start_encoding_load(name)
+    return encoding
+
+
+def _start_encoding_load(name: str) -> None:
+    """Load an encoding in a daemon thread unless a load is running or failed recently"""
+    now = time.monotonic()
+    with _encoding_lock:
+        started_at = _ENCODING_LOADS.get(name)
+        if started_at is not None:
+            if now - started_at < ENCODING_LOAD_TIMEOUT:
+                return
+            # The download hangs; give up on it and retry later in a new thread
+            logger.warning("Loading tiktoken encoding %s timed out", name)
+            del _ENCODING_LOADS[name]
+            _ENCODING_FAILURES[name] = now
+            return
+        failed_at = _ENCODING_FAILURES.get(name)
+        if failed_at is not None and now - failed_at < ENCODING_RETRY_SECONDS:
+            return
+        _ENCODING_LOADS[name] = now
+    threading.Thread(target=_load_encoding, args=(name,), daemon=True).start()
+
+
+def _load_encoding(name: str) -> None:
+    try:
+        import tiktoken
+        _ENCODINGS[name] = tiktoken.get_encoding(name)
+    except Exception as e:
+        # The BPE file could not be fetched; estimate from characters until the retry
+        logger.warning("Loading tiktoken encoding %s failed: %s", name, e)
+        with _encoding_lock:
+            _ENCODING_FAILURES[name] = time.monotonic()
+    finally:
+        with _encoding_lock:
+            _ENCODING_LOADS.pop(name, None)
 
 
 class JSONToCSVConverter:
     """Convert JSON data to CSV format"""
     
     @staticmethod
-    def convert(json_content: str) -> str:
+    def convert(json_content: str) -> Tuple[str, int]:
         """
         Convert JSON to CSV
         
@@ -99,45 +368,78 @@ class JSONToCSVConverter:
             json_content: JSON string content (array of objects)
             
         Returns:
-            CSV formatted string
+            Tuple of CSV formatted string and its data row count (excluding header)
         """
         try:
-            data = json.loads(json_content)
-            
-            # Handle single object
-            if isinstance(data, dict):
-                data = [data]
-            
-            if not isinstance(data, list):
-                raise ValidationException("JSON must be an array of objects")
+            data = json_utils.loads(json_content)
+            records, fieldnames = JSONToCSVConverter._prepare(data)
             
-            if not data:
-                raise ValidationException("JSON array is empty")
+            # Write CSV (writerows loops over the rows in C)
+            rows = [[item.get(key, '') for key in fieldnames] for item in records]
+            output = io.StringIO(newline='')
+            writer = csv.writer(output)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
             
-            # Get all unique keys from all objects
-            all_keys = set()
-            for item in data:
-                if isinstance(item, dict):
-                    all_keys.update(item.keys())
-            
-            if not all_keys:
-                raise ValidationException("No valid objects found in JSON")
-            
-            # Sort keys for consistent output
-            fieldnames = sorted(all_keys)
-            
-            # Write CSV
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for item in data:
-                if isinstance(item, dict):
-                    writer.writerow(item)
-            
-            return output.getvalue()
+            return output.getvalue(), len(rows)
             
         except json.JSONDecodeError as e:
             raise ValidationException(f"Invalid JSON: {str(e)}")
         except Exception as e:
             raise ProcessingException(f"Conversion failed: {str(e)}")
+    
+    @staticmethod
+    def iter_convert(data: Any) -> Iterator[str]:
+        """
+        Convert parsed JSON to CSV one row at a time
+        
+        The column set needs every object, so the input is validated
+        eagerly and only the output is streamed.
+        
+        Args:
+            data: Parsed JSON (array of objects or a single object)
+            
+        Returns:
+            Iterator of CSV lines, header first
+        """
+        records, fieldnames = JSONToCSVConverter._prepare(data)
+        
+        def generate() -> Iterator[str]:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fieldnames)
+            yield buffer.getvalue()
+            
+            for item in records:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow([item.get(key, '') for key in fieldnames])
+                yield buffer.getvalue()
+        
+        return generate()
+    
+    @staticmethod
+    def _prepare(data: Any) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Validate parsed JSON and return its objects and column names in first-seen order"""
+        # Handle single object
+        if isinstance(data, dict):
+            data = [data]
+        
+        if not isinstance(data, list):
+            raise ValidationException("JSON must be an array of objects")
+        
+        if not data:
+            raise ValidationException("JSON array is empty")
+        
+        # Non-object items are skipped; filter them out once
+        records = [item for item in data if isinstance(item, dict)]
+        
+        # Get all unique keys from all objects (dict keeps first-seen order)
+        all_keys = {}
+        for item in records:
+            all_keys.update(item)
+        
+        if not all_keys:
+            raise ValidationException("No valid objects found in JSON")
+        
+        return records, list(all_keys)
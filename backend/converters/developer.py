@@ -1,16 +1,28 @@
 """Developer Tools Converters"""
 import json
+import orjson
 import yaml
-import base64
+import pybase64
 import jwt
-from typing import Dict, Any
+from typing import Dict, Any, Union
+from core import json_utils
 from core.exceptions import ValidationException, ProcessingException
+from core.response_cache import response_cache
+
+# libyaml C bindings when available (bundled with the PyYAML wheels), pure Python otherwise
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAMLDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Signature algorithms accepted when verifying JWTs
+JWT_ALGORITHMS = ("HS256", "RS256")
+_jwt = jwt.PyJWT()
 
 
 class JSONToYAMLConverter:
     """Convert between JSON and YAML formats"""
     
     @staticmethod
+    @response_cache.cached
     def json_to_yaml(json_content: str) -> str:
         """
         Convert JSON to YAML
@@ -22,8 +34,8 @@ class JSONToYAMLConverter:
             YAML formatted string
         """
         try:
-            data = json.loads(json_content)
-            yaml_content = yaml.dump(data, default_flow_style=False, sort_keys=False)
+            data = json_utils.loads(json_content)
+            yaml_content = yaml.dump(data, Dumper=YAMLDumper, default_flow_style=False, sort_keys=False)
             return yaml_content
         except json.JSONDecodeError as e:
             raise ValidationException(f"Invalid JSON: {str(e)}")
@@ -31,6 +43,7 @@ class JSONToYAMLConverter:
             raise ProcessingException(f"Conversion failed: {str(e)}")
     
     @staticmethod
+    @response_cache.cached
     def yaml_to_json(yaml_content: str, pretty: bool = True) -> str:
         """
         Convert YAML to JSON
@@ -43,11 +56,21 @@ class JSONToYAMLConverter:
             JSON formatted string
         """
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=YAMLLoader)
+            # YAML mappings may have non-string keys (e.g. integers)
+            options = orjson.OPT_NON_STR_KEYS
             if pretty:
-                json_content = json.dumps(data, indent=2)
-            else:
-                json_content = json.dumps(data)
+                options |= orjson.OPT_INDENT_2
+            try:
+                json_content = orjson.dumps(data, option=options).decode('utf-8')
+            except orjson.JSONEncodeError:
+                # orjson rejects integers wider than 64 bits; json keeps them exact
+                json_content = json.dumps(
+                    data,
+                    indent=2 if pretty else None,
+                    separators=None if pretty else (',', ':'),
+                    ensure_ascii=False
+                )
             return json_content
         except yaml.YAMLError as e:
             raise ValidationException(f"Invalid YAML: {str(e)}")
@@ -70,7 +93,7 @@ class Base64Converter:
             Base64 encoded string
         """
         try:
-            encoded = base64.b64encode(text.encode('utf-8')).decode('utf-8')
+            encoded = pybase64.b64encode_as_string(text.encode('utf-8'))
             return encoded
         except Exception as e:
             raise ProcessingException(f"Encoding failed: {str(e)}")
@@ -87,24 +110,25 @@ class Base64Converter:
             Decoded plain text
         """
         try:
-            decoded = base64.b64decode(encoded_text).decode('utf-8')
+            decoded = pybase64.b64decode(encoded_text).decode('utf-8')
             return decoded
         except Exception as e:
             raise ValidationException(f"Invalid Base64 or decoding failed: {str(e)}")
     
     @staticmethod
-    def encode_file(file_data: bytes) -> str:
+    def encode_file(file_data: Union[bytes, bytearray, memoryview]) -> str:
         """
         Encode binary file to Base64
         
         Args:
-            file_data: Binary file data
+            file_data: Binary file data, or any buffer over it (slices of a
+                memoryview are encoded without copying)
             
         Returns:
             Base64 encoded string
         """
         try:
-            encoded = base64.b64encode(file_data).decode('utf-8')
+            encoded = pybase64.b64encode_as_string(memoryview(file_data))
             return encoded
         except Exception as e:
             raise ProcessingException(f"File encoding failed: {str(e)}")
@@ -127,25 +151,27 @@ class JWTDecoder:
             Dictionary with header, payload, and signature
         """
         try:
-            # Decode without verification first to get header and payload
-            unverified_header = jwt.get_unverified_header(token)
+            # Split token to show parts
+            parts = token.split('.')
             
             if verify:
                 if not secret:
                     raise ValidationException("Secret key required for verification")
-                decoded_payload = jwt.decode(token, secret, algorithms=["HS256", "RS256"])
+                decoded = _jwt.decode_complete(token, secret, algorithms=JWT_ALGORITHMS)
+                header, payload = decoded["header"], decoded["payload"]
             else:
-                decoded_payload = jwt.decode(token, options={"verify_signature": False})
-            
-            # Split token to show parts
-            parts = token.split('.')
+                # Nothing to check, so skip PyJWT and just decode the two JSON segments
+                if len(parts) != 3:
+                    raise jwt.DecodeError("Not enough segments" if len(parts) < 3 else "Too many segments")
+                header = _decode_segment(parts[0], "header")
+                payload = _decode_segment(parts[1], "payload")
             
             return {
-                "header": unverified_header,
-                "payload": decoded_payload,
+                "header": header,
+                "payload": payload,
                 "signature": parts[2] if len(parts) > 2 else None,
                 "verified": verify,
-                "algorithm": unverified_header.get('alg', 'unknown')
+                "algorithm": header.get('alg', 'unknown')
             }
             
         except jwt.ExpiredSignatureError:
@@ -154,3 +180,14 @@ class JWTDecoder:
             raise ValidationException(f"Invalid JWT token: {str(e)}")
         except Exception as e:
             raise ProcessingException(f"JWT decoding failed: {str(e)}")
+
+
+def _decode_segment(segment: str, name: str) -> Dict[str, Any]:
+    """Base64url-decode a JWT segment and parse it as a JSON object"""
+    try:
+        value = json_utils.loads(pybase64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError:
+        raise jwt.DecodeError(f"Invalid {name} padding or encoding")
+    if not isinstance(value, dict):
+        raise jwt.DecodeError(f"Invalid {name} string: must be a json object")
+    return value
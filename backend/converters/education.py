@@ -1,7 +1,10 @@
 """Education & Engineering Converters"""
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from core.exceptions import ValidationException, ProcessingException
 
+# Byte value -> two-digit uppercase hex, for formatting colour channels
+_HEX2 = [f"{i:02X}" for i in range(256)]
+
 
 class NumberSystemConverter:
     """Convert between number systems"""
@@ -13,6 +16,14 @@ class NumberSystemConverter:
         "hexadecimal": 16
     }
     
+    # format() spec emitting the bare digits for each system
+    FORMAT_SPECS = {
+        "binary": "b",
+        "octal": "o",
+        "decimal": "d",
+        "hexadecimal": "X"
+    }
+    
     @staticmethod
     def convert(number: str, from_system: str, to_system: str) -> Dict[str, Any]:
         """
@@ -41,16 +52,7 @@ class NumberSystemConverter:
             decimal_value = int(number, from_base)
             
             # Convert to target system
-            to_base = NumberSystemConverter.SYSTEMS[to_system]
-            
-            if to_system == "binary":
-                result = bin(decimal_value)[2:]  # Remove '0b' prefix
-            elif to_system == "octal":
-                result = oct(decimal_value)[2:]  # Remove '0o' prefix
-            elif to_system == "decimal":
-                result = str(decimal_value)
-            elif to_system == "hexadecimal":
-                result = hex(decimal_value)[2:].upper()  # Remove '0x' prefix
+            result = format(decimal_value, NumberSystemConverter.FORMAT_SPECS[to_system])
             
             return {
                 "original_number": number,
@@ -75,14 +77,21 @@ class ColorCodeConverter:
         hex_color = hex_color.lstrip('#')
         if len(hex_color) != 6:
             raise ValidationException("HEX color must be 6 characters")
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        try:
+            rgb = tuple(bytes.fromhex(hex_color))
+        except ValueError:
+            rgb = ()
+        # fromhex skips whitespace, so also check that three bytes came out
+        if len(rgb) != 3:
+            raise ValidationException(f"Invalid HEX color: #{hex_color}")
+        return rgb
     
     @staticmethod
     def rgb_to_hex(r: int, g: int, b: int) -> str:
         """Convert RGB to HEX"""
         if not all(0 <= c <= 255 for c in [r, g, b]):
             raise ValidationException("RGB values must be between 0 and 255")
-        return f"#{r:02x}{g:02x}{b:02x}".upper()
+        return "#" + _HEX2[r] + _HEX2[g] + _HEX2[b]
     
     @staticmethod
     def rgb_to_hsl(r: int, g: int, b: int) -> tuple:
@@ -129,6 +138,49 @@ class ColorCodeConverter:
         
         return (c, m, y, k)
     
+    @staticmethod
+    def rgb_to_hsl_cmyk(r: int, g: int, b: int) -> Tuple[tuple, tuple]:
+        """Convert RGB to both HSL and CMYK, normalizing the channels once"""
+        if not all(0 <= c <= 255 for c in [r, g, b]):
+            raise ValidationException("RGB values must be between 0 and 255")
+        
+        r, g, b = r / 255.0, g / 255.0, b / 255.0
+        max_c = max(r, g, b)
+        min_c = min(r, g, b)
+        
+        # HSL (same steps as rgb_to_hsl)
+        l = (max_c + min_c) / 2.0
+        if max_c == min_c:
+            h = s = 0.0
+        else:
+            d = max_c - min_c
+            s = d / (2.0 - max_c - min_c) if l > 0.5 else d / (max_c + min_c)
+            
+            if max_c == r:
+                h = (g - b) / d + (6 if g < b else 0)
+            elif max_c == g:
+                h = (b - r) / d + 2
+            else:
+                h = (r - g) / d + 4
+            h /= 6
+        hsl = (int(h * 360), int(s * 100), int(l * 100))
+        
+        # CMYK (same steps as rgb_to_cmyk)
+        if max_c == 0:
+            return hsl, (0, 0, 0, 100)
+        
+        c = 1 - r
+        m = 1 - g
+        y = 1 - b
+        k = min(c, m, y)
+        cmyk = (
+            int(((c - k) / (1 - k)) * 100),
+            int(((m - k) / (1 - k)) * 100),
+            int(((y - k) / (1 - k)) * 100),
+            int(k * 100)
+        )
+        return hsl, cmyk
+    
     @staticmethod
     def convert(color_value: str, from_format: str, to_format: str = None) -> Dict[str, Any]:
         """
@@ -158,8 +210,7 @@ class ColorCodeConverter:
             
             # Generate all formats
             hex_color = ColorCodeConverter.rgb_to_hex(r, g, b)
-            h, s, l = ColorCodeConverter.rgb_to_hsl(r, g, b)
-            c, m, y, k = ColorCodeConverter.rgb_to_cmyk(r, g, b)
+            (h, s, l), (c, m, y, k) = ColorCodeConverter.rgb_to_hsl_cmyk(r, g, b)
             
             result = {
                 "hex": hex_color,
@@ -193,104 +244,112 @@ class PercentageCalculator:
         Calculate percentage
         
         Args:
-            calculation_type: Type of calculation (percentage_of, increase, decrease, change)
+            calculation_type: Type of calculation (percentage_of, what_percent, increase, decrease, change)
             **kwargs: Values needed for calculation
             
         Returns:
             Dictionary with calculation result
         """
-        calc_type = calculation_type.lower()
+        entry = _PERCENTAGE_HANDLERS.get(calculation_type.lower())
+        if entry is None:
+            raise ValidationException(f"Unsupported calculation type: {calculation_type}")
+        
+        handler, required = entry
+        missing = [name for name in required if name not in kwargs]
+        if missing:
+            raise ValidationException(f"Missing values for {calculation_type}: {', '.join(missing)}")
         
         try:
-            if calc_type == "percentage_of":
-                # What is X% of Y?
-                percentage = kwargs.get('percentage', 0)
-                total = kwargs.get('total', 0)
-                result = (percentage / 100) * total
-                
-                return {
-                    "type": "percentage_of",
-                    "percentage": percentage,
-                    "total": total,
-                    "result": round(result, 2),
-                    "formula": f"{percentage}% of {total} = {round(result, 2)}"
-                }
-            
-            elif calc_type == "what_percent":
-                # X is what % of Y?
-                value = kwargs.get('value', 0)
-                total = kwargs.get('total', 0)
-                
-                if total == 0:
-                    raise ValidationException("Total cannot be zero")
-                
-                percentage = (value / total) * 100
-                
-                return {
-                    "type": "what_percent",
-                    "value": value,
-                    "total": total,
-                    "percentage": round(percentage, 2),
-                    "formula": f"{value} is {round(percentage, 2)}% of {total}"
-                }
-            
-            elif calc_type == "increase":
-                # Increase X by Y%
-                value = kwargs.get('value', 0)
-                percentage = kwargs.get('percentage', 0)
-                increase = (percentage / 100) * value
-                result = value + increase
-                
-                return {
-                    "type": "increase",
-                    "original_value": value,
-                    "percentage": percentage,
-                    "increase_amount": round(increase, 2),
-                    "result": round(result, 2),
-                    "formula": f"{value} + {percentage}% = {round(result, 2)}"
-                }
-            
-            elif calc_type == "decrease":
-                # Decrease X by Y%
-                value = kwargs.get('value', 0)
-                percentage = kwargs.get('percentage', 0)
-                decrease = (percentage / 100) * value
-                result = value - decrease
-                
-                return {
-                    "type": "decrease",
-                    "original_value": value,
-                    "percentage": percentage,
-                    "decrease_amount": round(decrease, 2),
-                    "result": round(result, 2),
-                    "formula": f"{value} - {percentage}% = {round(result, 2)}"
-                }
-            
-            elif calc_type == "change":
-                # Percentage change from X to Y
-                old_value = kwargs.get('old_value', 0)
-                new_value = kwargs.get('new_value', 0)
-                
-                if old_value == 0:
-                    raise ValidationException("Old value cannot be zero")
-                
-                change = ((new_value - old_value) / old_value) * 100
-                
-                return {
-                    "type": "percentage_change",
-                    "old_value": old_value,
-                    "new_value": new_value,
-                    "change_percentage": round(change, 2),
-                    "direction": "increase" if change > 0 else "decrease",
-                    "formula": f"Change from {old_value} to {new_value} = {round(change, 2)}%"
-                }
-            
-            else:
-                raise ValidationException(f"Unsupported calculation type: {calculation_type}")
-                
+            return handler(*(kwargs[name] for name in required))
         except ZeroDivisionError:
             raise ValidationException("Division by zero error")
         except Exception as e:
             if isinstance(e, (ValidationException, ProcessingException)):
                 raise
             raise ProcessingException(f"Calculation failed: {str(e)}")
+
+
+def _percentage_of(percentage: float, total: float) -> Dict[str, Any]:
+    """What is X% of Y?"""
+    result = (percentage / 100) * total
+    
+    return {
+        "type": "percentage_of",
+        "percentage": percentage,
+        "total": total,
+        "result": round(result, 2),
+        "formula": f"{percentage}% of {total} = {round(result, 2)}"
+    }
+
+
+def _what_percent(value: float, total: float) -> Dict[str, Any]:
+    """X is what % of Y?"""
+    if total == 0:
+        raise ValidationException("Total cannot be zero")
+    
+    percentage = (value / total) * 100
+    
+    return {
+        "type": "what_percent",
+        "value": value,
+        "total": total,
+        "percentage": round(percentage, 2),
+        "formula": f"{value} is {round(percentage, 2)}% of {total}"
+    }
+
+
+def _increase(value: float, percentage: float) -> Dict[str, Any]:
+    """Increase X by Y%"""
+    increase = (percentage / 100) * value
+    result = value + increase
+    
+    return {
+        "type": "increase",
+        "original_value": value,
+        "percentage": percentage,
+        "increase_amount": round(increase, 2),
+        "result": round(result, 2),
+        "formula": f"{value} + {percentage}% = {round(result, 2)}"
+    }
+
+
+def _decrease(value: float, percentage: float) -> Dict[str, Any]:
+    """Decrease X by Y%"""
+    decrease = (percentage / 100) * value
+    result = value - decrease
+    
+    return {
+        "type": "decrease",
+        "original_value": value,
+        "percentage": percentage,
+        "decrease_amount": round(decrease, 2),
+        "result": round(result, 2),
+        "formula": f"{value} - {percentage}% = {round(result, 2)}"
+    }
+
+
+def _change(old_value: float, new_value: float) -> Dict[str, Any]:
+    """Percentage change from X to Y"""
+    if old_value == 0:
+        raise ValidationException("Old value cannot be zero")
+    
+    change = ((new_value - old_value) / old_value) * 100
+    
+    return {
+        "type": "percentage_change",
+        "old_value": old_value,
+        "new_value": new_value,
+        "change_percentage": round(change, 2),
+        "direction": "increase" if change > 0 else "decrease",
+        "formula": f"Change from {old_value} to {new_value} = {round(change, 2)}%"
+    }
+
+
+# Calculation type -> (handler, names of the values it needs, in order)
+_PERCENTAGE_HANDLERS = {
+    "percentage_of": (_percentage_of, ("percentage", "total")),
+    "what_percent": (_what_percent, ("value", "total")),
+    "increase": (_increase, ("value", "percentage")),
+    "decrease": (_decrease, ("value", "percentage")),
+    "change": (_change, ("old_value", "new_value"))
+}
@@ -1,8 +1,17 @@
 """Finance Converters"""
-import requests
-from typing import Dict, Any
+import asyncio
+import httpx
+import orjson
+from functools import partial
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from core.config import settings
 from core.exceptions import ValidationException, ProcessingException
+from core.quote_cache import QuoteCache
+
+
+CENT = Decimal("0.01")
 
 
 class CurrencyConverter:
@@ -12,7 +21,12 @@ class CurrencyConverter:
     API_URL = "https://api.exchangerate-api.com/v4/latest/{base}"
     
     @staticmethod
-    def convert(amount: float, from_currency: str, to_currency: str) -> Dict[str, Any]:
+    async def convert(
+        amount: float,
+        from_currency: str,
+        to_currency: str,
+        client: httpx.AsyncClient
+    ) -> Dict[str, Any]:
         """
         Convert currency amounts
         
@@ -20,44 +34,87 @@ class CurrencyConverter:
             amount: Amount to convert
             from_currency: Source currency code (e.g., USD)
             to_currency: Target currency code (e.g., EUR)
+            client: Shared HTTP client used to reach the rates API
             
         Returns:
             Dictionary with conversion result and rate
         """
-        if amount < 0:
+        results = await CurrencyConverter.convert_many([(amount, from_currency, to_currency)], client)
+        return results[0]
+    
+    @staticmethod
+    async def convert_many(
+        conversions: List[Tuple[float, str, str]],
+        client: httpx.AsyncClient
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert several currency amounts, fetching each base currency's rates once
+        
+        Args:
+            conversions: (amount, from_currency, to_currency) tuples
+            client: Shared HTTP client used to reach the rates API
+            
+        Returns:
+            List of conversion results, in the same order as conversions
+        """
+        if any(amount < 0 for amount, _, _ in conversions):
             raise ValidationException("Amount must be positive")
         
-        from_currency = from_currency.upper()
-        to_currency = to_currency.upper()
+        conversions = [
+            (amount, from_currency.upper(), to_currency.upper())
+            for amount, from_currency, to_currency in conversions
+        ]
         
         try:
-            # Fetch exchange rates
-            response = requests.get(
-                CurrencyConverter.API_URL.format(base=from_currency),
-                timeout=5
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            if to_currency not in data.get('rates', {}):
-                raise ValidationException(f"Unsupported currency: {to_currency}")
+            # Fetch exchange rates concurrently, once per base currency (cached)
+            bases = list(dict.fromkeys(from_currency for _, from_currency, _ in conversions))
+            rate_tables = await asyncio.gather(*(
+                _exchange_rates.get(base, partial(CurrencyConverter.fetch_rates, client, base))
+                for base in bases
+            ))
+            rates_by_base = dict(zip(bases, rate_tables))
             
-            rate = data['rates'][to_currency]
-            converted_amount = amount * rate
+            timestamp = datetime.now().isoformat()
+            results = []
+            for amount, from_currency, to_currency in conversions:
+                rates = rates_by_base[from_currency]
+                if to_currency not in rates:
+                    raise ValidationException(f"Unsupported currency: {to_currency}")
+                
+                rate = rates[to_currency]
+                converted_amount = amount * rate
+                
+                results.append({
+                    "from_currency": from_currency,
+                    "to_currency": to_currency,
+                    "amount": amount,
+                    "converted_amount": round(converted_amount, 2),
+                    "exchange_rate": rate,
+                    "timestamp": timestamp
+                })
             
-            return {
-                "from_currency": from_currency,
-                "to_currency": to_currency,
-                "amount": amount,
-                "converted_amount": round(converted_amount, 2),
-                "exchange_rate": rate,
-                "timestamp": datetime.now().isoformat()
-            }
+            return results
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise ProcessingException(f"Failed to fetch exchange rates: {str(e)}")
         except Exception as e:
             raise ProcessingException(f"Currency conversion failed: {str(e)}")
+    
+    @staticmethod
+    async def fetch_rates(client: httpx.AsyncClient, base: str) -> Dict[str, float]:
+        """
+        Fetch the latest exchange rates from the upstream API
+        
+        Args:
+            client: Shared HTTP client
+            base: Base currency code
+            
+        Returns:
+            Mapping of currency code to rate against base
+        """
+        response = await client.get(CurrencyConverter.API_URL.format(base=base))
+        response.raise_for_status()
+        return orjson.loads(response.content).get('rates', {})
 
 
 class CryptoPriceTracker:
@@ -78,12 +135,17 @@ class CryptoPriceTracker:
     }
     
     @staticmethod
-    def get_price(crypto_symbol: str, vs_currency: str = "USD") -> Dict[str, Any]:
+    async def get_price(
+        crypto_symbol: str,
+        client: httpx.AsyncClient,
+        vs_currency: str = "USD"
+    ) -> Dict[str, Any]:
         """
         Get cryptocurrency price
         
         Args:
             crypto_symbol: Crypto symbol (BTC, ETH, etc.)
+            client: Shared HTTP client used to reach the prices API
             vs_currency: Target currency (USD, EUR, etc.)
             
         Returns:
@@ -98,22 +160,11 @@ class CryptoPriceTracker:
         coin_id = CryptoPriceTracker.SUPPORTED_COINS[crypto_symbol]
         
         try:
-            response = requests.get(
-                CryptoPriceTracker.API_URL,
-                params={
-                    "ids": coin_id,
-                    "vs_currencies": vs_currency,
-                    "include_24hr_change": "true"
-                },
-                timeout=5
+            # Fetch price data (cached per coin and currency)
+            price_data = await _crypto_prices.get(
+                (coin_id, vs_currency),
+                partial(CryptoPriceTracker.fetch_price, client, coin_id, vs_currency)
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            if coin_id not in data:
-                raise ProcessingException("Failed to fetch price data")
-            
-            price_data = data[coin_id]
             price = price_data.get(vs_currency, 0)
             change_24h = price_data.get(f"{vs_currency}_24h_change", 0)
             
@@ -125,15 +176,48 @@ class CryptoPriceTracker:
                 "timestamp": datetime.now().isoformat()
             }
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise ProcessingException(f"Failed to fetch crypto price: {str(e)}")
         except Exception as e:
             raise ProcessingException(f"Price tracking failed: {str(e)}")
+    
+    @staticmethod
+    async def fetch_price(client: httpx.AsyncClient, coin_id: str, vs_currency: str) -> Dict[str, Any]:
+        """
+        Fetch price data from the upstream API
+        
+        Args:
+            client: Shared HTTP client
+            coin_id: CoinGecko coin id (e.g., bitcoin)
+            vs_currency: Target currency, lowercase
+            
+        Returns:
+            Price data with the price and 24h change keyed by currency
+        """
+        response = await client.get(
+            CryptoPriceTracker.API_URL,
+            params={
+                "ids": coin_id,
+                "vs_currencies": vs_currency,
+                "include_24hr_change": "true"
+            }
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        if coin_id not in data:
+            raise ProcessingException("Failed to fetch price data")
+        
+        return data[coin_id]
 
 
 class GSTCalculator:
     """Calculate GST/VAT/Sales Tax"""
     
+    # Largest accepted amount; keeps every cent-quantized result within the
+    # 28 significant digits of the default decimal context
+    MAX_AMOUNT = 1e15
+    
     @staticmethod
     def calculate(amount: float, tax_rate: float, include_tax: bool = False) -> Dict[str, Any]:
         """
@@ -150,24 +234,44 @@ class GSTCalculator:
         if amount < 0:
             raise ValidationException("Amount must be positive")
         
+        # Also rejects inf and nan, which never compare as in range
+        if not amount <= GSTCalculator.MAX_AMOUNT:
+            raise ValidationException(f"Amount must not exceed {GSTCalculator.MAX_AMOUNT:,.0f}")
+        
         if not 0 <= tax_rate <= 100:
             raise ValidationException("Tax rate must be between 0 and 100")
         
+        # Exact decimal money math, rounded half-up to cents; the parts always
+        # add up to the total
+        amount_dec = Decimal(str(amount)).quantize(CENT, ROUND_HALF_UP)
+        rate = Decimal(str(tax_rate)) / 100
+        
         if include_tax:
             # Amount includes tax, extract base amount
-            base_amount = amount / (1 + tax_rate / 100)
-            tax_amount = amount - base_amount
-            total_amount = amount
+            total_amount = amount_dec
+            base_amount = (amount_dec / (1 + rate)).quantize(CENT, ROUND_HALF_UP)
+            tax_amount = total_amount - base_amount
         else:
             # Amount is base, calculate tax
-            base_amount = amount
-            tax_amount = amount * (tax_rate / 100)
-            total_amount = amount + tax_amount
+            base_amount = amount_dec
+            tax_amount = (amount_dec * rate).quantize(CENT, ROUND_HALF_UP)
+            total_amount = base_amount + tax_amount
         
         return {
-            "base_amount": round(base_amount, 2),
+            "base_amount": float(base_amount),
             "tax_rate_percent": tax_rate,
-            "tax_amount": round(tax_amount, 2),
-            "total_amount": round(total_amount, 2),
+            "tax_amount": float(tax_amount),
+            "total_amount": float(total_amount),
             "tax_included": include_tax
         }
+
+
+# Upstream quotes, shared across requests (stale-while-revalidate)
+_exchange_rates = QuoteCache(
+    ttl=settings.QUOTE_CACHE_TTL,
+    stale_if_error=settings.QUOTE_STALE_IF_ERROR
+)
+_crypto_prices = QuoteCache(
+    ttl=settings.QUOTE_CACHE_TTL,
+    stale_if_error=settings.QUOTE_STALE_IF_ERROR
+)
@@ -1,23 +1,65 @@
 """Media Converters"""
-import base64
 import io
-from PIL import Image
-from PyPDF2 import PdfReader
-from typing import Dict, Any
+import logging
+import math
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+import pybase64
+import pypdfium2 as pdfium
+from PIL import Image, features
+from typing import Dict, Any, BinaryIO, Iterator, List, Optional, Union
 from core.exceptions import ValidationException, ProcessingException, UnsupportedFormatException
 
+logger = logging.getLogger(__name__)
+
+# The Pillow wheels link libjpeg-turbo (SIMD DCT, colour conversion and
+# Huffman coding); a source build against plain libjpeg encodes several
+# times slower, so flag it once at import
+if not features.check_feature("libjpeg_turbo"):
+    logger.warning("Pillow is not built with libjpeg-turbo; JPEG encoding will be slow")
+
+# PDFium is not thread-safe, even across separate documents, so every call
+# into it from the request threadpool is serialized on this lock
+_pdfium_lock = threading.Lock()
+
+
+def _reset_pdfium_lock() -> None:
+    """Give a forked child its own lock; one inherited while another thread held it never unlocks"""
+    global _pdfium_lock
+    _pdfium_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_pdfium_lock)
+
+
+def _as_stream(data: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a stream; pass file-like objects (e.g. spooled uploads) through"""
+    if hasattr(data, 'read'):
+        data.seek(0)
+        return data
+    return io.BytesIO(data)
+
 
 class ImageToWebPConverter:
     """Convert images to WebP format for web optimization"""
     
+    # libwebp effort level; 4 is several times faster than 6 for a
+    # marginally larger file
+    DEFAULT_METHOD = 4
+    
     @staticmethod
-    def convert(image_data: bytes, quality: int = 85) -> bytes:
+    def convert(image_data: Union[bytes, BinaryIO], quality: int = 85, method: int = DEFAULT_METHOD) -> bytes:
         """
         Convert image to WebP format
         
         Args:
-            image_data: Binary image data
+            image_data: Binary image data or a binary file object
             quality: WebP quality (1-100)
+            method: Encoder effort (0 = fastest, 6 = smallest file)
             
         Returns:
             WebP image bytes
@@ -25,9 +67,12 @@ class ImageToWebPConverter:
         if not 1 <= quality <= 100:
             raise ValidationException("Quality must be between 1 and 100")
         
+        if not 0 <= method <= 6:
+            raise ValidationException("Method must be between 0 and 6")
+        
         try:
             # Open image
-            image = Image.open(io.BytesIO(image_data))
+            image = Image.open(_as_stream(image_data))
             
             # Convert to RGB if necessary (WebP doesn't support all modes)
             if image.mode not in ('RGB', 'RGBA'):
@@ -35,7 +80,7 @@ class ImageToWebPConverter:
             
             # Save as WebP
             output = io.BytesIO()
-            image.save(output, format='WEBP', quality=quality, method=6)
+            image.save(output, format='WEBP', quality=quality, method=method)
             output.seek(0)
             
             return output.getvalue()
@@ -47,13 +92,22 @@ class ImageToWebPConverter:
 class ImageCompressorConverter:
     """Compress images while maintaining quality"""
     
+    # Lowest quality tried when searching for the target size
+    MIN_QUALITY = 20
+    
+    # Images with more pixels than a MAX_DIMENSION square that are over 4x
+    # the target size are first scaled down to MAX_PIXELS, keeping their
+    # aspect ratio; quality alone cannot get them there
+    MAX_DIMENSION = 2000
+    MAX_PIXELS = MAX_DIMENSION * MAX_DIMENSION
+    
     @staticmethod
-    def compress(image_data: bytes, max_size_kb: int = 500, quality: int = 85) -> Dict[str, Any]:
+    def compress(image_data: Union[bytes, BinaryIO], max_size_kb: int = 500, quality: int = 85) -> Dict[str, Any]:
         """
         Compress image to target size
         
         Args:
-            image_data: Binary image data
+            image_data: Binary image data or a binary file object
             max_size_kb: Maximum target size in KB
             quality: Initial quality (will be adjusted)
             
@@ -61,43 +115,80 @@ class ImageCompressorConverter:
             Dictionary with compressed image and metadata
         """
         try:
-            image = Image.open(io.BytesIO(image_data))
-            original_size = len(image_data)
+            stream = _as_stream(image_data)
+            original_size = stream.seek(0, io.SEEK_END)
+            stream.seek(0)
+            image = Image.open(stream)
+            
+            target_size = max_size_kb * 1024
+            
+            # Already small enough: return the upload as-is. Image.open only
+            # read the header, so no pixels are decoded on this path
+            if original_size <= target_size:
+                stream.seek(0)
+                return {
+                    "compressed_image": pybase64.b64encode_as_string(stream.read()),
+                    "original_size_bytes": original_size,
+                    "compressed_size_bytes": original_size,
+                    "compression_ratio_percent": 0.0,
+                    "final_quality": quality,
+                    "width": image.width,
+                    "height": image.height
+                }
             
             # Get original format
             original_format = image.format or 'JPEG'
             
-            # Try to compress
+            # Convert once; every encode below reuses the same pixels
+            if image.mode not in ('RGB', 'RGBA', 'L'):
+                image = image.convert('RGB')
+            
+            # Encode cost scales with pixel count, so shrink oversized images first
+            pixels = image.width * image.height
+            if pixels > ImageCompressorConverter.MAX_PIXELS and original_size > target_size * 4:
+                scale = math.sqrt(ImageCompressorConverter.MAX_PIXELS / pixels)
+                image.thumbnail((int(image.width * scale), int(image.height * scale)), Image.Resampling.LANCZOS)
+            
+            # Try to compress, reusing one output buffer for every encode
             output = io.BytesIO()
-            current_quality = quality
             
-            while current_quality > 10:
+            def encode(q: int) -> bytes:
                 output.seek(0)
                 output.truncate()
-                
-                if image.mode not in ('RGB', 'RGBA', 'L'):
-                    image = image.convert('RGB')
-                
-                image.save(output, format=original_format, quality=current_quality, optimize=True)
-                
-                compressed_size = output.tell()
-                
-                if compressed_size <= max_size_kb * 1024 or current_quality <= 20:
-                    break
-                
-                current_quality -= 5
+                image.save(output, format=original_format, quality=q, optimize=True)
+                return output.getvalue()
             
-            output.seek(0)
-            compressed_data = output.getvalue()
+            current_quality = quality
+            compressed_data = encode(quality)
+            
+            if len(compressed_data) > target_size:
+                # Binary search for the highest quality that fits; if none
+                # does, the last encode (at the lowest quality) is kept
+                lo, hi = min(ImageCompressorConverter.MIN_QUALITY, quality), quality - 1
+                best = None
+                while lo <= hi:
+                    q = (lo + hi) // 2
+                    candidate = encode(q)
+                    if len(candidate) <= target_size:
+                        best = (q, candidate)
+                        lo = q + 1
+                    else:
+                        current_quality, compressed_data = q, candidate
+                        hi = q - 1
+                
+                if best is not None:
+                    current_quality, compressed_data = best
             
             compression_ratio = (1 - len(compressed_data) / original_size) * 100
             
             return {
-                "compressed_image": base64.b64encode(compressed_data).decode('utf-8'),
+                "compressed_image": pybase64.b64encode_as_string(compressed_data),
                 "original_size_bytes": original_size,
                 "compressed_size_bytes": len(compressed_data),
                 "compression_ratio_percent": round(compression_ratio, 2),
-                "final_quality": current_quality
+                "final_quality": current_quality,
+                "width": image.width,
+                "height": image.height
             }
             
         except Exception as e:
@@ -107,40 +198,151 @@ class ImageCompressorConverter:
 class PDFToTextConverter:
     """Extract text from PDF files"""
     
+    # Documents with at least this many pages are split across the process
+    # pool, in ranges of at least this many pages
+    PARALLEL_MIN_PAGES = 8
+    
     @staticmethod
-    def extract_text(pdf_data: bytes) -> Dict[str, Any]:
+    def extract_text(pdf_data: Union[bytes, BinaryIO], executor: Optional[Executor] = None) -> Dict[str, Any]:
         """
         Extract text from PDF
         
         Args:
-            pdf_data: Binary PDF data
+            pdf_data: Binary PDF data or a binary file object
+            executor: Optional process pool for extracting page ranges of
+                large documents in parallel (PDFium cannot run in threads)
             
         Returns:
             Dictionary with extracted text and metadata
         """
         try:
-            pdf_file = io.BytesIO(pdf_data)
-            reader = PdfReader(pdf_file)
+            stream = _as_stream(pdf_data)
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(stream)
+                try:
+                    page_count = len(pdf)
+                    parallel = executor is not None and page_count >= PDFToTextConverter.PARALLEL_MIN_PAGES
+                    if not parallel:
+                        page_texts = [_page_text(pdf, index) for index in range(page_count)]
+                finally:
+                    pdf.close()
             
-            # Extract text from all pages
-            text_content = []
-            for page_num, page in enumerate(reader.pages, 1):
-                page_text = page.extract_text()
-                text_content.append({
-                    "page": page_num,
-                    "text": page_text.strip()
-                })
+            if parallel:
+                page_texts = _extract_parallel(stream, page_count, executor)
             
-            # Combine all text
-            full_text = "\n\n".join([p["text"] for p in text_content if p["text"]])
+            text_content = [
+                {"page": page_num, "text": text}
+                for page_num, text in enumerate(page_texts, 1)
+            ]
+            
+            # Combine all non-empty page texts into one buffer, counting words
+            # per page so no list of every word in the document is built
+            buffer = io.StringIO()
+            word_count = 0
+            for text in page_texts:
+                if text:
+                    if buffer.tell():
+                        buffer.write("\n\n")
+                    buffer.write(text)
+                    word_count += len(text.split())
+            full_text = buffer.getvalue()
             
             return {
-                "total_pages": len(reader.pages),
+                "total_pages": page_count,
                 "text": full_text,
                 "pages": text_content,
                 "character_count": len(full_text),
-                "word_count": len(full_text.split())
+                "word_count": word_count
             }
             
         except Exception as e:
             raise ProcessingException(f"PDF text extraction failed: {str(e)}")
+    
+    @staticmethod
+    def iter_pages(pdf_data: Union[bytes, BinaryIO]) -> Iterator[Dict[str, Any]]:
+        """
+        Extract text from PDF one page at a time
+        
+        The document is opened eagerly so an unreadable PDF is rejected
+        before any page is produced.
+        
+        Args:
+            pdf_data: Binary PDF data or a binary file object
+            
+        Returns:
+            Iterator of {"page": n, "text": str} dictionaries
+        """
+        try:
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(_as_stream(pdf_data))
+                page_count = len(pdf)
+        except Exception as e:
+            raise ProcessingException(f"PDF text extraction failed: {str(e)}")
+        
+        def generate() -> Iterator[Dict[str, Any]]:
+            try:
+                for index in range(page_count):
+                    # Only hold the lock while extracting, not while the client reads
+                    with _pdfium_lock:
+                        text = _page_text(pdf, index)
+                    yield {
+                        "page": index + 1,
+                        "text": text
+                    }
+            finally:
+                with _pdfium_lock:
+                    pdf.close()
+        
+        return generate()
+
+
+def _extract_parallel(stream: BinaryIO, page_count: int, executor: Executor) -> List[str]:
+    """Split a document into page ranges, extract them in the pool and return the texts in order"""
+    # More ranges than workers would only queue, each reopening the document
+    workers = getattr(executor, "max_workers", None) or os.cpu_count() or 1
+    chunks = max(1, min(workers, page_count // PDFToTextConverter.PARALLEL_MIN_PAGES))
+    size = -(-page_count // chunks)
+    ranges = [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+    
+    # Workers open the document from a temporary file rather than each
+    # receiving a pickled copy of it
+    stream.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as file:
+        shutil.copyfileobj(stream, file)
+    try:
+        futures = [executor.submit(_extract_page_range, file.name, *page_range) for page_range in ranges]
+        
+        page_texts = []
+        for future, page_range in zip(futures, ranges):
+            try:
+                page_texts.extend(future.result())
+            except BrokenProcessPool:
+                # A worker died; a WorkerPool replaces itself on submit, so retry once
+                page_texts.extend(executor.submit(_extract_page_range, file.name, *page_range).result())
+        return page_texts
+    finally:
+        os.unlink(file.name)
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of the PDF at path; runs in a worker process with its own PDFium"""
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(path)
+        try:
+            return [_page_text(pdf, index) for index in range(start, stop)]
+        finally:
+            pdf.close()
+
+
+def _page_text(pdf: pdfium.PdfDocument, index: int) -> str:
+    """Extract one page's text; the caller must hold _pdfium_lock"""
+    page = pdf[index]
+    try:
+        textpage = page.get_textpage()
+        try:
+            # PDFium ends lines with CRLF
+            return textpage.get_text_range().replace("\r\n", "\n").strip()
+        finally:
+            textpage.close()
+    finally:
+        page.close()
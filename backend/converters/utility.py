@@ -1,16 +1,35 @@
 """Daily Utility Converters"""
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo, available_timezones
-import qrcode
+import segno
 import io
-import base64
-from typing import Dict, Any
+import pybase64
+from typing import Dict, Any, Tuple
 from core.exceptions import ValidationException, ProcessingException
+from core.response_cache import response_cache
+
+# Walking the tzdata database is slow, so the set of valid names is built once
+_ALL_TIMEZONES = frozenset(available_timezones())
+
+
+def _build_pair_factors(conversions: Dict[str, Dict[str, Any]]) -> Dict[Tuple[str, str, str], float]:
+    """Precompute the from/to factor for every unit pair of the linear categories"""
+    return {
+        (category, from_unit, to_unit): from_factor / to_factor
+        for category, units in conversions.items()
+        if category != "temperature"
+        for from_unit, from_factor in units.items()
+        for to_unit, to_factor in units.items()
+    }
 
 
 class UnitConverter:
     """Convert between different units"""
     
+    # Namespace for static methods; instances carry no state
+    __slots__ = ()
+    
     CONVERSIONS = {
         # Length (to meters)
         "length": {
@@ -50,6 +69,9 @@ class UnitConverter:
         }
     }
     
+    # (category, from_unit, to_unit) -> multiplier
+    PAIR_FACTORS = _build_pair_factors(CONVERSIONS)
+    
     @staticmethod
     def convert(value: float, from_unit: str, to_unit: str, category: str) -> Dict[str, Any]:
         """
@@ -64,21 +86,16 @@ class UnitConverter:
         Returns:
             Dictionary with conversion result
         """
-        if category not in UnitConverter.CONVERSIONS:
-            raise ValidationException(f"Unsupported category: {category}")
-        
-        units = UnitConverter.CONVERSIONS[category]
-        
-        if from_unit not in units or to_unit not in units:
-            raise ValidationException(f"Invalid units for category {category}")
-        
-        # Special handling for temperature
-        if category == "temperature":
+        try:
+            result = value * UnitConverter.PAIR_FACTORS[(category, from_unit, to_unit)]
+        except KeyError:
+            units = UnitConverter.CONVERSIONS.get(category)
+            if units is None:
+                raise ValidationException(f"Unsupported category: {category}")
+            if category != "temperature" or from_unit not in units or to_unit not in units:
+                raise ValidationException(f"Invalid units for category {category}")
+            # Special handling for temperature
             result = UnitConverter._convert_temperature(value, from_unit, to_unit)
-        else:
-            # Convert to base unit, then to target unit
-            base_value = value * units[from_unit]
-            result = base_value / units[to_unit]
         
         return {
             "original_value": value,
@@ -89,6 +106,7 @@ class UnitConverter:
         }
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
         """Convert temperature between units"""
         # Convert to Celsius first
@@ -127,14 +145,14 @@ class TimezoneConverter:
         """
         try:
             # Validate timezones
-            if from_timezone not in available_timezones():
+            if from_timezone not in _ALL_TIMEZONES:
                 raise ValidationException(f"Invalid source timezone: {from_timezone}")
-            if to_timezone not in available_timezones():
+            if to_timezone not in _ALL_TIMEZONES:
                 raise ValidationException(f"Invalid target timezone: {to_timezone}")
             
             # Parse date or use today
             if date_str:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+                date_obj = date.fromisoformat(date_str)
             else:
                 date_obj = datetime.now().date()
             
@@ -144,7 +162,7 @@ class TimezoneConverter:
             # Combine date and time
             dt_naive = datetime.combine(date_obj, time_obj)
             
-            # Localize to source timezone
+            # Localize to source timezone (ZoneInfo caches instances per key)
             dt_source = dt_naive.replace(tzinfo=ZoneInfo(from_timezone))
             
             # Convert to target timezone
@@ -167,7 +185,12 @@ class TimezoneConverter:
 class QRCodeGenerator:
     """Generate QR codes from text/URLs"""
     
+    # zlib level for the PNG; 6 is ~30% faster to encode than segno's
+    # default 9 for a few percent more bytes, lower levels barely gain speed
+    PNG_COMPRESS_LEVEL = 6
+    
     @staticmethod
+    @response_cache.cached
     def generate(data: str, size: int = 10, border: int = 4) -> Dict[str, Any]:
         """
         Generate QR code
@@ -190,29 +213,22 @@ class QRCodeGenerator:
             raise ValidationException("Border must be at least 4")
         
         try:
-            # Create QR code
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=size,
-                border=border,
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-            
-            # Generate image
-            img = qr.make_image(fill_color="black", back_color="white")
+            # Create QR code (smallest version that fits the data)
+            qr = segno.make(data, error='L', micro=False)
             
-            # Convert to bytes
+            # Write PNG straight from the module matrix
             buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            buffer.seek(0)
+            qr.save(
+                buffer, kind='png', scale=size, border=border, dark='black', light='white',
+                compresslevel=QRCodeGenerator.PNG_COMPRESS_LEVEL
+            )
             
-            # Encode to Base64
-            img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            # Encode to Base64 straight from the buffer, without a getvalue() copy
+            with buffer.getbuffer() as png:
+                img_base64 = pybase64.b64encode_as_string(png)
             
             return {
-                "qr_code_image": f"data:image/png;base64,{img_base64}",
+                "qr_code_image": "data:image/png;base64," + img_base64,
                 "data": data,
                 "size": size,
                 "border": border
@@ -0,0 +1,114 @@
+"""Micro-batching for concurrent converter calls"""
+import asyncio
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+import anyio.to_thread
+
+
+class AsyncBatcher:
+    """
+    Group concurrent calls into batches processed in one worker-thread call.
+
+    The worker task only collects batches; each batch runs in its own task,
+    so a slow batch does not hold up the ones queued after it. The worker
+    task is started lazily on first use so the batcher also works where the
+    ASGI lifespan is disabled (Mangum).
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 64,
+        max_queue_time: float = 0.01
+    ):
+        """
+        Args:
+            process_batch: Sync function mapping a list of items to a list of
+                results in the same order; an Exception in place of a result
+                fails only that item
+            max_batch_size: Maximum items handed to process_batch at once
+            max_queue_time: Seconds to wait for more items after the first
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Strong references to running batches, also used to cancel them on stop
+        self._batches: Set[asyncio.Task] = set()
+
+    async def process(self, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def stop(self) -> None:
+        """Cancel the worker and running batches; callers still waiting get CancelledError"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        for task in self._batches:
+            task.cancel()
+        await asyncio.gather(*self._batches, return_exceptions=True)
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_queue_time
+
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                _cancel_all(batch)
+                raise
+
+            task = asyncio.create_task(self._process(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _process(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await anyio.to_thread.run_sync(
+                self.process_batch, [item for item, _ in batch]
+            )
+        except asyncio.CancelledError:
+            _cancel_all(batch)
+            raise
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _cancel_all(batch: List[Tuple[Any, asyncio.Future]]) -> None:
+    for _, future in batch:
+        future.cancel()
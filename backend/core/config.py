@@ -1,5 +1,6 @@
 """Application configuration"""
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from pydantic_settings import BaseSettings
 
 
@@ -14,35 +15,53 @@ class Settings(BaseSettings):
     # API Config
     API_PREFIX: str = "/api"
     DEBUG: bool = True
+    THREADPOOL_SIZE: int = 100  # Worker threads for sync (CPU-bound) endpoints
+    BATCH_MAX_REQUESTS: int = 20  # Max sub-requests per /batch call
+    TOKEN_BATCH_SIZE: int = 64  # Max token-count requests grouped per tokenizer call
+    TOKEN_BATCH_WAIT: float = 0.01  # Seconds to wait for more token-count requests
+    IMAGE_POOL_WORKERS: int = 2  # Image encoding and large-PDF processes per app worker (0 = use threads)
     
     # CORS
-    ALLOWED_ORIGINS: list = [
+    ALLOWED_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:8000",
         "http://127.0.0.1:3000",
         "http://127.0.0.1:8000",
         "https://*.netlify.app",
         "https://*.netlify.com"
-    ]
+    )
     
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_HOUR: int = 100
     PREMIUM_RATE_LIMIT: int = 1000
     
+    # Response Cache (pure converters only)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Total size of cached results
+    RESPONSE_CACHE_TTL: int = 300  # seconds
+    
     # External APIs (for converters that need them)
     CURRENCY_API_KEY: Optional[str] = None  # For currency converter
     CRYPTO_API_KEY: Optional[str] = None    # For crypto tracker
+    QUOTE_CACHE_TTL: int = 60  # Seconds exchange rates and crypto prices stay fresh
+    QUOTE_STALE_IF_ERROR: int = 3600  # Seconds a cached quote may be served when the upstream API fails
     
     # File Upload Limits
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB for Netlify free tier
-    ALLOWED_IMAGE_TYPES: list = ["image/jpeg", "image/png", "image/webp", "image/gif"]
-    ALLOWED_FILE_TYPES: list = ["application/pdf", "text/csv", "application/json"]
+    ALLOWED_IMAGE_TYPES: Tuple[str, ...] = ("image/jpeg", "image/png", "image/webp", "image/gif")
+    ALLOWED_FILE_TYPES: Tuple[str, ...] = ("application/pdf", "text/csv", "application/json")
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the settings, reading the environment and .env only once"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,32 @@
+"""Shared HTTP client for upstream APIs"""
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client, creating it on first use.
+
+    Reusing one client keeps TLS connections to upstream APIs alive between
+    requests. It is created lazily so it also works where the ASGI lifespan
+    is disabled (Mangum).
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
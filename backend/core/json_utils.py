@@ -0,0 +1,34 @@
+"""JSON parsing that keeps large integers exact"""
+import json
+import re
+from typing import Any, Union
+
+import orjson
+
+# orjson turns integers outside the 64-bit range into floats. Only input with
+# a run of 19+ digits can hold one; false positives just take the slow path
+_LONG_DIGITS = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def loads(content: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson, falling back to the json module where orjson would lose precision
+
+    Args:
+        content: JSON document
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON
+    """
+    pattern = _LONG_DIGITS_BYTES if isinstance(content, bytes) else _LONG_DIGITS
+    if pattern.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let json report the error, or accept what only it parses (e.g. 1e400)
+            pass
+    return json.loads(content)
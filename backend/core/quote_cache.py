@@ -0,0 +1,87 @@
+"""TTL cache with stale-while-revalidate for upstream quotes"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class QuoteCache:
+    """
+    Cache results of a slow async fetch.
+
+    Entries younger than ttl are returned as-is. Entries between ttl and
+    2 * ttl are returned stale while a background task refreshes them.
+    Older or missing entries are fetched inline; if that fails, an entry no
+    older than stale_if_error is served instead and otherwise the error
+    reaches the caller. Concurrent fetches of one key share a single call.
+    Entries are only touched from the event loop, so no lock is needed.
+    """
+
+    def __init__(self, ttl: float = 60, stale_if_error: float = 0):
+        """
+        Args:
+            ttl: Seconds a value is considered fresh
+            stale_if_error: Seconds a value may still be served when fetching fails
+        """
+        self.ttl = ttl
+        self.stale_if_error = stale_if_error
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for key, fetching or refreshing as needed
+
+        Args:
+            key: Cache key
+            fetch: Coroutine function returning a fresh value for key
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return await self._refresh(key, fetch)
+
+        value, fetched_at = entry
+        age = time.monotonic() - fetched_at
+        if age < self.ttl:
+            return value
+        if age < 2 * self.ttl:
+            self._refresh_in_background(key, fetch)
+            return value
+
+        try:
+            return await self._refresh(key, fetch)
+        except Exception:
+            if age < self.stale_if_error:
+                return value
+            raise
+
+    def clear(self) -> None:
+        """Drop all cached values"""
+        self._entries.clear()
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        # Concurrent misses for the same key share one upstream fetch
+        task = self._inflight.get(key) or self._start_fetch(key, fetch)
+        return await asyncio.shield(task)
+
+    def _refresh_in_background(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key not in self._inflight:
+            self._start_fetch(key, fetch)
+
+    def _start_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        async def run():
+            value = await fetch()
+            self._entries[key] = (value, time.monotonic())
+            return value
+
+        def done(task: asyncio.Task) -> None:
+            self._inflight.pop(key, None)
+            if not task.cancelled():
+                # Mark the error as retrieved; a failed background refresh
+                # keeps serving the stale value until it expires
+                task.exception()
+
+        # The dict also holds the reference that keeps the task alive
+        task = asyncio.create_task(run())
+        self._inflight[key] = task
+        task.add_done_callback(done)
+        return task
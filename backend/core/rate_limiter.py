@@ -1,22 +1,87 @@
 """Rate limiting functionality"""
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from .config import settings
+import math
+import time
+from functools import partial
+from typing import Iterable
 
+from cachetools import LRUCache
+from fastapi.responses import JSONResponse
 
-def get_rate_limit_key(request):
-    """Get rate limit key based on IP address"""
-    # In production, you might want to use user ID for authenticated users
-    return get_remote_address(request)
+from .exceptions import RateLimitException
 
 
-# Initialize rate limiter
-limiter = Limiter(
-    key_func=get_rate_limit_key,
-    default_limits=[f"{settings.RATE_LIMIT_PER_HOUR}/hour"]
-)
+class TokenBucketMiddleware:
+    """
+    ASGI middleware enforcing a per-client token bucket.
 
+    Each client IP holds (tokens, last_refill); tokens refill continuously
+    at refill_rate per second up to capacity and every request takes one.
+    Buckets are only touched from the event loop, so no lock is needed.
+    State is per process: on serverless deployments every cold instance
+    starts with full buckets, so the limit there is best-effort only.
 
-def get_limiter():
-    """Get limiter instance for dependency injection"""
-    return limiter
+    Endpoints that do more than one request's worth of work (e.g. /batch)
+    can charge extra tokens through request.state.rate_limit(tokens), which
+    returns 0 if allowed, else seconds until enough tokens are available.
+    """
+
+    def __init__(
+        self,
+        app,
+        capacity: float,
+        refill_rate: float,
+        max_clients: int = 100_000,
+        exempt_paths: Iterable[str] = ()
+    ):
+        """
+        Args:
+            app: Wrapped ASGI application
+            capacity: Burst size (maximum stored tokens)
+            refill_rate: Tokens added per second
+            max_clients: Buckets kept before least recently used are evicted
+            exempt_paths: Paths that are never rate limited (health checks, docs)
+        """
+        self.app = app
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.exempt_paths = frozenset(exempt_paths)
+        self._buckets = LRUCache(maxsize=max_clients)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        # In production, you might want to use user ID for authenticated users
+        client = scope.get("client")
+        key = client[0] if client else "unknown"
+        wait = self._consume(key)
+        if not wait:
+            scope.setdefault("state", {})["rate_limit"] = partial(self._consume, key)
+            await self.app(scope, receive, send)
+            return
+
+        await rate_limit_response(wait)(scope, receive, send)
+
+    def _consume(self, key: str, tokens_needed: float = 1) -> float:
+        """Take tokens for key; return 0 if allowed, else seconds until enough are available"""
+        now = time.monotonic()
+        tokens, last_refill = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
+
+        if tokens >= tokens_needed:
+            self._buckets[key] = (tokens - tokens_needed, now)
+            return 0.0
+
+        self._buckets[key] = (tokens, now)
+        return (tokens_needed - tokens) / self.refill_rate
+
+
+def rate_limit_response(wait: float) -> JSONResponse:
+    """Build the 429 response telling the client how long to wait"""
+    exc = RateLimitException()
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"error": exc.message},
+        headers={"Retry-After": str(math.ceil(wait))}
+    )
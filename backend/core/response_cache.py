@@ -0,0 +1,93 @@
+"""In-process cache for pure converter results"""
+import functools
+import hashlib
+import pickle
+import threading
+from typing import Callable
+
+from cachetools import TTLCache
+
+from .config import settings
+
+
+class ResponseCache:
+    """
+    TTL cache with frequency-based admission, bounded by result size.
+
+    A result is only stored once its key has been requested admit_after
+    times within admit_window seconds, so one-off payloads never evict
+    hot entries. Keys are argument hashes, so only results take memory;
+    max_bytes bounds their total size.
+
+    Hashing the arguments costs a few microseconds plus time linear in their
+    size, so only decorate converters whose work clearly costs more.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300,
+        admit_after: int = 3,
+        admit_window: float = 60,
+        max_tracked: int = 10_000
+    ):
+        self.admit_after = admit_after
+        self.max_entry_bytes = max_bytes // 16
+        self._cache = TTLCache(maxsize=max_bytes, ttl=ttl, getsizeof=_result_size)
+        self._hits = TTLCache(maxsize=max_tracked, ttl=admit_window)
+        self._lock = threading.Lock()
+
+    def cached(self, func: Callable) -> Callable:
+        """Decorate a pure function so repeated calls are served from the cache"""
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(func, args, kwargs)
+            with self._lock:
+                try:
+                    return self._cache[key]
+                except KeyError:
+                    pass
+                hits = self._hits.get(key, 0) + 1
+                self._hits[key] = hits
+
+            result = func(*args, **kwargs)
+
+            # Oversized results would evict many hot entries at once
+            if hits >= self.admit_after and _result_size(result) <= self.max_entry_bytes:
+                with self._lock:
+                    self._cache[key] = result
+                    self._hits.pop(key, None)
+            return result
+
+        return wrapper
+
+    def clear(self) -> None:
+        """Drop all cached results and hit counters"""
+        with self._lock:
+            self._cache.clear()
+            self._hits.clear()
+
+
+def _make_key(func: Callable, args: tuple, kwargs: dict) -> bytes:
+    """Hash the function identity and its arguments"""
+    payload = pickle.dumps((func.__module__, func.__qualname__, args, kwargs))
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _result_size(value: object) -> int:
+    """Approximate bytes held by a cached result; its strings dominate"""
+    if isinstance(value, (str, bytes)):
+        return 64 + len(value)
+    if isinstance(value, dict):
+        return 64 + sum(_result_size(item) for item in value.values())
+    return 64
+
+
+# Shared cache instance
+response_cache = ResponseCache(
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl=settings.RESPONSE_CACHE_TTL
+)
@@ -0,0 +1,26 @@
+"""HTTP response classes"""
+import json
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class ORJSONFallbackResponse(ORJSONResponse):
+    """
+    Serialize with orjson, falling back to the json module for content it rejects.
+
+    orjson refuses integers wider than 64 bits (e.g. a 40-digit hex number
+    converted to decimal); json.dumps writes them exactly.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except orjson.JSONEncodeError:
+            return json.dumps(
+                content,
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":")
+            ).encode("utf-8")
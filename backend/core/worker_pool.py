@@ -0,0 +1,50 @@
+"""Process pool for CPU-bound converters"""
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+
+class WorkerPool(Executor):
+    """
+    ProcessPoolExecutor that replaces itself once it is broken.
+
+    A worker killed mid-task (out of memory on a decompression bomb, a crash
+    in PIL or PDFium) leaves a ProcessPoolExecutor permanently broken; here
+    the next submit swaps in a fresh pool instead. Workers are started via
+    forkserver (spawn where unavailable), never forked from the server
+    process, whose threads may hold locks at fork time.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Args:
+            max_workers: Worker processes in the pool
+        """
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.max_workers = max_workers
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._pool = self._create()
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        pool = self._pool
+        try:
+            return pool.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            return self._replace(pool).submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _create(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._mp_context)
+
+    def _replace(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Swap out a broken pool; concurrent callers that saw the same pool share one replacement"""
+        with self._lock:
+            if self._pool is broken:
+                broken.shutdown(wait=False)
+                self._pool = self._create()
+            return self._pool
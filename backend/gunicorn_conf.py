@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for self-hosted deployments
+
+Run from the backend directory:
+    gunicorn -c gunicorn_conf.py api.main:app
+"""
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# One event loop per worker process so CPU-bound converters scale with cores
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+
+# Import the app once in the master, share it copy-on-write with workers
+preload_app = True
+
+# SO_REUSEPORT lets the kernel balance connections across workers
+reuse_port = True
@@ -0,0 +1,55 @@
+"""Tests for the streaming AI & Data endpoints"""
+import json
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routes.ai_data import STREAM_SPOOL_SIZE
+
+client = TestClient(app)
+
+
+def test_csv_stream_converts_rows():
+    response = client.post("/api/ai-data/csv-to-jsonl-stream", content=b"name,age\nAlice,30\nBob,25\n")
+
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"name": "Alice", "age": "30"},
+        {"name": "Bob", "age": "25"},
+    ]
+
+
+def test_csv_stream_spooled_to_disk():
+    row = b"x" * 1000 + b",1\n"
+    rows = STREAM_SPOOL_SIZE // len(row) + 10
+    response = client.post("/api/ai-data/csv-to-jsonl-stream", content=b"name,n\n" + row * rows)
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == rows
+
+
+def test_csv_stream_rejects_non_utf8_header():
+    response = client.post("/api/ai-data/csv-to-jsonl-stream", content="naïve,b\n1,2\n".encode("latin-1"))
+
+    assert response.status_code == 422
+    assert "UTF-8" in response.json()["detail"]
+
+
+def test_csv_stream_rejects_non_utf8_after_first_line():
+    body = b"a,b\n" + b"1,2\n" * 1000 + "é,3\n".encode("latin-1")
+    response = client.post("/api/ai-data/csv-to-jsonl-stream", content=body)
+
+    assert response.status_code == 422
+
+
+def test_csv_stream_rejects_truncated_utf8():
+    response = client.post("/api/ai-data/csv-to-jsonl-stream", content="a,b\n1,é".encode("utf-8")[:-1])
+
+    assert response.status_code == 422
+
+
+def test_json_stream_rejects_non_utf8():
+    response = client.post("/api/ai-data/json-to-csv-stream", content='[{"name": "Zoë"}]'.encode("latin-1"))
+
+    assert response.status_code == 422
+    assert "UTF-8" in response.json()["detail"]
@@ -0,0 +1,89 @@
+"""Tests for the async micro-batcher"""
+import asyncio
+import time
+
+import pytest
+
+from core.batcher import AsyncBatcher
+
+
+def _process(items):
+    results = []
+    for item in items:
+        if item == "slow":
+            time.sleep(0.5)
+        results.append(ValueError(item) if item == "bad" else item.upper())
+    return results
+
+
+def test_slow_batch_does_not_block_later_batches():
+    async def scenario():
+        batcher = AsyncBatcher(_process, max_batch_size=1, max_queue_time=0)
+        slow = asyncio.create_task(batcher.process("slow"))
+        await asyncio.sleep(0.05)
+        start = time.monotonic()
+        assert await batcher.process("fast") == "FAST"
+        fast_time = time.monotonic() - start
+        assert await slow == "SLOW"
+        await batcher.stop()
+        return fast_time
+
+    assert asyncio.run(scenario()) < 0.3
+
+
+def test_failure_is_reported_per_item():
+    async def scenario():
+        batcher = AsyncBatcher(_process, max_batch_size=10, max_queue_time=0.05)
+        good, bad, other = (asyncio.create_task(batcher.process(item)) for item in ("a", "bad", "b"))
+        with pytest.raises(ValueError):
+            await bad
+        results = (await good, await other)
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(scenario()) == ("A", "B")
+
+
+def test_token_count_failure_is_limited_to_its_model(monkeypatch):
+    from api.routes.ai_data import TokenCountRequest, _count_tokens_batch
+    from converters.ai_data import TokenCounterConverter
+
+    count_tokens_batch = TokenCounterConverter.count_tokens_batch
+
+    def failing_for_one_model(texts, model, usages=None):
+        if model == "broken":
+            raise RuntimeError("tokenizer failed")
+        return count_tokens_batch(texts, model, usages)
+
+    monkeypatch.setattr(TokenCounterConverter, "count_tokens_batch", staticmethod(failing_for_one_model))
+    results = _count_tokens_batch([
+        TokenCountRequest(text="hello world", model="claude"),
+        TokenCountRequest(text="hello world", model="broken"),
+    ])
+
+    assert results[0]["model"] == "claude"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_stop_resolves_every_waiting_caller():
+    async def scenario():
+        batcher = AsyncBatcher(_process, max_batch_size=1, max_queue_time=0)
+        callers = [asyncio.create_task(batcher.process(item)) for item in ("slow", "x", "y")]
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        done, pending = await asyncio.wait(callers, timeout=1)
+        return pending
+
+    assert not asyncio.run(scenario())
+
+
+def test_queued_items_are_cancelled_on_stop():
+    async def scenario():
+        batcher = AsyncBatcher(_process)
+        batcher._queue = asyncio.Queue()
+        future = asyncio.get_running_loop().create_future()
+        batcher._queue.put_nowait(("x", future))
+        await batcher.stop()
+        return future
+
+    assert asyncio.run(scenario()).cancelled()
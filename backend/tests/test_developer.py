@@ -0,0 +1,26 @@
+"""Tests for the developer converters"""
+import base64
+import json
+
+import jwt
+
+from converters.developer import JWTDecoder
+
+
+def _segment(value: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+
+def test_unverified_jwt_keeps_large_integers_exact():
+    token = ".".join([_segment({"alg": "HS256", "typ": "JWT"}), _segment({"id": 2 ** 70}), "sig"])
+
+    result = JWTDecoder.decode(token)
+
+    assert result["payload"]["id"] == 2 ** 70
+    assert isinstance(result["payload"]["id"], int)
+
+
+def test_unverified_and_verified_decode_agree():
+    token = jwt.encode({"sub": "1", "n": 12345678901234567890123}, "secret", algorithm="HS256")
+
+    assert JWTDecoder.decode(token)["payload"] == JWTDecoder.decode(token, verify=True, secret="secret")["payload"]
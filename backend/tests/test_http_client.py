@@ -0,0 +1,15 @@
+"""Tests for the shared upstream HTTP client's lifetime"""
+from fastapi.testclient import TestClient
+
+from api.main import app
+from core.http_client import get_http_client
+
+
+def test_shutdown_closes_the_client_routes_use():
+    with TestClient(app):
+        client = get_http_client()
+        assert not client.is_closed
+        assert not hasattr(app.state, "http")
+
+    assert client.is_closed
+    assert get_http_client() is not client
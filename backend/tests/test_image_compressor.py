@@ -0,0 +1,35 @@
+"""Tests for image compression downscaling"""
+import io
+
+import pytest
+from PIL import Image
+
+from converters.media import ImageCompressorConverter
+
+
+def _noise_jpeg(width, height):
+    buffer = io.BytesIO()
+    Image.effect_noise((width, height), 64).save(buffer, "JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def test_pixel_budget_is_a_max_dimension_square():
+    dimension = ImageCompressorConverter.MAX_DIMENSION
+    assert ImageCompressorConverter.MAX_PIXELS == dimension * dimension
+
+
+@pytest.mark.parametrize("size", [(2000, 2000), (4000, 1000)])
+def test_images_at_the_pixel_budget_keep_their_size(size):
+    result = ImageCompressorConverter.compress(_noise_jpeg(*size), max_size_kb=1)
+
+    assert (result["width"], result["height"]) == size
+
+
+@pytest.mark.parametrize("size", [(2001, 2000), (8000, 1000)])
+def test_images_over_the_pixel_budget_are_scaled_down_to_it(size):
+    result = ImageCompressorConverter.compress(_noise_jpeg(*size), max_size_kb=1)
+
+    width, height = result["width"], result["height"]
+    assert width * height <= ImageCompressorConverter.MAX_PIXELS
+    assert width * height > ImageCompressorConverter.MAX_PIXELS * 0.99
+    assert abs(width / height - size[0] / size[1]) < 0.01
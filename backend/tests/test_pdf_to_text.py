@@ -0,0 +1,48 @@
+"""Tests for parallel PDF text extraction"""
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pypdfium2 as pdfium
+
+from converters.media import PDFToTextConverter
+
+
+def _blank_pdf(pages):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(pages):
+        pdf.new_page(612, 792)
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf.close()
+    return buffer.getvalue()
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self, max_workers):
+        super().__init__(max_workers)
+        self.max_workers = max_workers
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls.append(args)
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_page_ranges_are_capped_at_the_pool_size():
+    with RecordingExecutor(2) as executor:
+        result = PDFToTextConverter.extract_text(_blank_pdf(64), executor)
+
+    assert result["total_pages"] == 64
+    assert [args[1:] for args in executor.calls] == [(0, 32), (32, 64)]
+
+
+def test_workers_receive_a_file_path_that_is_removed_afterwards():
+    with RecordingExecutor(2) as executor:
+        PDFToTextConverter.extract_text(_blank_pdf(16), executor)
+
+    paths = {args[0] for args in executor.calls}
+    assert len(paths) == 1
+    path = paths.pop()
+    assert isinstance(path, str)
+    assert not os.path.exists(path)
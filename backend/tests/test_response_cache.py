@@ -0,0 +1,45 @@
+"""Tests for the converter response cache"""
+from core.response_cache import ResponseCache
+
+
+def _counting(cache: ResponseCache, size: int):
+    calls = []
+
+    @cache.cached
+    def convert(value: str) -> str:
+        calls.append(value)
+        return value * size
+
+    return convert, calls
+
+
+def test_result_is_cached_after_admission():
+    cache = ResponseCache(max_bytes=1024 * 1024, admit_after=2)
+    convert, calls = _counting(cache, 10)
+
+    for _ in range(4):
+        assert convert("a") == "a" * 10
+
+    assert calls == ["a", "a"]
+
+
+def test_total_size_is_bounded_in_bytes():
+    cache = ResponseCache(max_bytes=64 * 1024, admit_after=1)
+    convert, _ = _counting(cache, 1000)
+
+    for i in range(200):
+        convert(f"{i:04}")
+
+    assert cache._cache.currsize <= 64 * 1024
+    assert len(cache._cache) < 200
+
+
+def test_oversized_result_is_not_cached():
+    cache = ResponseCache(max_bytes=64 * 1024, admit_after=1)
+    convert, calls = _counting(cache, 10_000)
+
+    convert("x")
+    convert("x")
+
+    assert calls == ["x", "x"]
+    assert len(cache._cache) == 0
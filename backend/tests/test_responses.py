@@ -0,0 +1,30 @@
+"""Tests for HTTP response serialization"""
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+client = TestClient(app)
+
+
+def test_number_system_decimal_wider_than_64_bits():
+    response = client.post("/api/education/number-system", json={
+        "number": "f" * 40,
+        "from_system": "hexadecimal",
+        "to_system": "decimal"
+    })
+
+    assert response.status_code == 200
+    assert response.json()["decimal_value"] == 16 ** 40 - 1
+    assert response.json()["converted_number"] == str(16 ** 40 - 1)
+
+
+def test_fallback_keeps_value_at_2_pow_64_exact():
+    response = client.post("/api/education/number-system", json={
+        "number": str(2 ** 64),
+        "from_system": "decimal",
+        "to_system": "hexadecimal"
+    })
+
+    assert response.status_code == 200
+    assert response.json()["decimal_value"] == 2 ** 64
+    assert b'"decimal_value":18446744073709551616' in response.content
@@ -0,0 +1,75 @@
+"""Tests for tokenizer loading in the token counter"""
+import threading
+import time
+
+import pytest
+
+import converters.ai_data as ai_data
+from converters.ai_data import TokenCounterConverter
+
+
+class _FakeEncoding:
+    def encode_ordinary(self, text):
+        return text.split()
+
+
+@pytest.fixture
+def encoder_state(monkeypatch):
+    monkeypatch.setattr(ai_data, "_ENCODINGS", {})
+    monkeypatch.setattr(ai_data, "_ENCODING_LOADS", {})
+    monkeypatch.setattr(ai_data, "_ENCODING_FAILURES", {})
+
+
+def test_slow_encoding_load_does_not_block_counting(encoder_state, monkeypatch):
+    import tiktoken
+
+    release = threading.Event()
+
+    def slow_get_encoding(name):
+        release.wait(5)
+        return _FakeEncoding()
+
+    monkeypatch.setattr(tiktoken, "get_encoding", slow_get_encoding)
+
+    start = time.monotonic()
+    result = TokenCounterConverter.count_tokens("one two three four five six seven eight", "gpt-4")
+    assert time.monotonic() - start < 1
+    assert result["estimated_tokens"] == len("one two three four five six seven eight") // 4
+
+    release.set()
+    for _ in range(100):
+        if ai_data._ENCODINGS:
+            break
+        time.sleep(0.01)
+    assert TokenCounterConverter.count_tokens("one two three", "gpt-4")["estimated_tokens"] == 3
+
+
+def test_failed_load_is_retried_after_the_backoff(encoder_state, monkeypatch):
+    import tiktoken
+
+    def failing_get_encoding(name):
+        raise OSError("blob host unreachable")
+
+    monkeypatch.setattr(tiktoken, "get_encoding", failing_get_encoding)
+    ai_data._get_encoder("gpt-4")
+    for _ in range(100):
+        if ai_data._ENCODING_FAILURES:
+            break
+        time.sleep(0.01)
+
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda name: _FakeEncoding())
+    ai_data._get_encoder("gpt-4")
+    assert not ai_data._ENCODING_LOADS
+
+    monkeypatch.setattr(ai_data, "ENCODING_RETRY_SECONDS", 0)
+    ai_data._get_encoder("gpt-4")
+    for _ in range(100):
+        if ai_data._ENCODINGS:
+            break
+        time.sleep(0.01)
+    assert ai_data._get_encoder("gpt-4") is not None
+
+
+def test_unknown_models_are_not_cached(encoder_state):
+    assert ai_data._get_encoder("some-client-chosen-name") is None
+    assert not ai_data._ENCODING_LOADS and not ai_data._ENCODINGS
@@ -0,0 +1,50 @@
+"""Tests for the self-replacing worker process pool"""
+import io
+import os
+import signal
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from api.main import app
+from core.worker_pool import WorkerPool
+
+
+def _kill_self():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(1)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_replaces_itself_after_a_worker_is_killed(pool):
+    first_pid = pool.submit(os.getpid).result()
+
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(_kill_self).result()
+
+    assert pool.submit(os.getpid).result() != first_pid
+
+
+def test_image_endpoint_survives_a_killed_worker():
+    image = io.BytesIO()
+    Image.new("RGB", (64, 64), "red").save(image, "PNG")
+
+    with TestClient(app) as client:
+        pool = app.state.image_pool
+        pool.submit(os.getpid).result()
+        for pid in list(pool._pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        for _ in range(2):
+            response = client.post(
+                "/api/media/image-to-webp",
+                files={"file": ("red.png", image.getvalue(), "image/png")}
+            )
+            assert response.status_code == 200
@@ -3,7 +3,6 @@ Netlify Function - API Handler
 Wraps the FastAPI application for serverless deployment
 """
 import sys
-import os
 from pathlib import Path
 
 # Get the absolute path to backend directory